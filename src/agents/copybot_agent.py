@@ -7,7 +7,7 @@ Monitors OHLCV data and market structure to make informed position sizing decisi
 import os
 import pandas as pd
 from termcolor import colored, cprint
-from dotenv import load_dotenv
+from src.utils.env import load_environment
 from datetime import datetime, timedelta
 import time
 from src.config import *
@@ -62,7 +62,7 @@ class CopyBotAgent:
     
     def __init__(self):
         """Initialize the CopyBot agent with LLM"""
-        load_dotenv()
+        load_environment()
         self.model = None
         max_retries = 3
         retry_count = 0
@@ -0,0 +1,105 @@
+"""
+DeFi Dialogue Agent
+Turns natural-language trade instructions into structured parameters
+"""
+
+import hashlib
+import os
+from typing import Any, Dict
+import httpx
+import orjson
+from redis import asyncio as aioredis
+from termcolor import cprint
+
+DEEPSEEK_BASE_URL = "https://api.deepseek.com"
+
+# Repeated instructions ("买入500个SOL" and friends) are common and the
+# agent runs at temperature 0, so identical prompts produce identical
+# completions — cache them for an hour instead of paying 500ms-5s of
+# inference again
+redis_client = aioredis.from_url(
+    os.getenv("REDIS_URL", "redis://localhost:6379"),
+    decode_responses=False
+)
+LLM_CACHE_TTL = 3600
+
+SYSTEM_PROMPT = """You are a Solana trading assistant.
+Parse the user's instruction into JSON with keys:
+token (mint address or symbol), direction (buy/sell),
+amount_sol (float), condition (optional dict).
+Reply in the user's language (中文 or English) plus the JSON block."""
+
+class DefiDialogueAgent:
+    def __init__(self):
+        self.api_key = os.getenv("DEEPSEEK_API_KEY", "")
+        self.model = "deepseek-chat"
+        self.temperature = 0
+        self.cache_stats = {"hits": 0, "misses": 0}
+        # One pooled HTTP/2 client for the agent's lifetime; a client per
+        # call redid DNS+TLS before every completion, dominating
+        # first-byte latency. HTTP/2 multiplexes concurrent chats over
+        # one connection.
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20,
+                                keepalive_expiry=60),
+            http2=True,
+            timeout=30.0
+        )
+
+    async def aclose(self):
+        """Close the pooled client (call on application shutdown)"""
+        await self._http.aclose()
+
+    async def process_user_input(self, text: str, user_id: str = "anonymous") -> Dict[str, Any]:
+        """Get the model's reply and parsed parameters for an instruction"""
+        cache_key = None
+        if self.temperature == 0:
+            digest = hashlib.sha256(
+                (SYSTEM_PROMPT + text + self.model).encode()
+            ).hexdigest()
+            cache_key = f"llm:{digest}"
+            try:
+                cached = await redis_client.get(cache_key)
+                if cached:
+                    self.cache_stats["hits"] += 1
+                    return orjson.loads(cached)
+            except Exception:
+                pass
+        self.cache_stats["misses"] += 1
+        try:
+            response = await self._http.post(
+                f"{DEEPSEEK_BASE_URL}/chat/completions",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                json={
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": text}
+                    ],
+                    "temperature": self.temperature
+                }
+            )
+            response.raise_for_status()
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
+            result = {"response": content, "parameters": self._extract_json(content)}
+            if cache_key:
+                try:
+                    await redis_client.setex(cache_key, LLM_CACHE_TTL, orjson.dumps(result))
+                except Exception:
+                    pass
+            return result
+        except Exception as e:
+            cprint(f"❌ Dialogue agent error: {e}", "red")
+            return {"response": "", "parameters": {}, "error": str(e)}
+
+    def _extract_json(self, content: str) -> Dict[str, Any]:
+        """Pull the first JSON object out of the model reply"""
+        start = content.find("{")
+        end = content.rfind("}")
+        if start == -1 or end <= start:
+            return {}
+        try:
+            return orjson.loads(content[start:end + 1])
+        except Exception:
+            return {}
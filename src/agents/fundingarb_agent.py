@@ -11,7 +11,7 @@ from pathlib import Path
 import re
 
 import pandas as pd
-from dotenv import load_dotenv
+from src.utils.env import load_environment
 from src.models import model_factory
 import openai
 
@@ -94,7 +94,7 @@ class FundingArbAgent(BaseAgent):
                 print(f"  - Max Tokens: {AI_MAX_TOKENS}")
         
         # Load environment variables
-        load_dotenv()
+        load_environment()
         
         # Get OpenAI key for TTS
         openai_key = os.getenv("OPENAI_KEY")
@@ -8,7 +8,7 @@ import pandas as pd
 import time
 from datetime import datetime, timedelta
 from termcolor import colored, cprint
-from dotenv import load_dotenv
+from src.utils.env import load_environment
 import openai
 from pathlib import Path
 from src.models import model_factory
@@ -87,7 +87,7 @@ class LiquidationAgent(BaseAgent):
         # Set AI parameters
         self.ai_temperature = AI_TEMPERATURE if AI_TEMPERATURE > 0 else config.AI_TEMPERATURE
         
-        load_dotenv()
+        load_environment()
         
         # Get OpenAI key for TTS
         openai_key = os.getenv("OPENAI_KEY")
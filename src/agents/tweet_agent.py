@@ -9,7 +9,7 @@ import pandas as pd
 import time
 from datetime import datetime
 from pathlib import Path
-from dotenv import load_dotenv
+from src.utils.env import load_environment
 import traceback
 from src.models import model_factory
 import math
@@ -82,7 +82,7 @@ class TweetAgent:
     
     def __init__(self):
         """Initialize the Tweet Agent"""
-        load_dotenv()
+        load_environment()
         
         # Check Twitter configuration
         self.twitter_enabled = os.getenv('TWITTER_ENABLED', 'true').lower() == 'true'
@@ -112,7 +112,7 @@ class TweetAgent:
             if AI_MAX_TOKENS > 0:
                 print(f"  - Max Tokens: {AI_MAX_TOKENS}")
         
-        load_dotenv()
+        load_environment()
         
         # Initialize Ollama model
         self.model = None
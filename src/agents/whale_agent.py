@@ -17,7 +17,7 @@ import pandas as pd
 import time
 from datetime import datetime, timedelta
 from termcolor import colored, cprint
-from dotenv import load_dotenv
+from src.utils.env import load_environment
 import openai
 from pathlib import Path
 from src import nice_funcs as n
@@ -91,7 +91,7 @@ class WhaleAgent(BaseAgent):
             if AI_MAX_TOKENS > 0:
                 print(f"  - Max Tokens: {AI_MAX_TOKENS}")
         
-        load_dotenv()
+        load_environment()
         
         # Get OpenAI key for TTS
         openai_key = os.getenv("OPENAI_KEY")
@@ -1,18 +1,44 @@
+from dataclasses import dataclass
 from typing import Dict, Optional
 import requests
 import json
 import os
 import time
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from termcolor import cprint
 import websockets
 import asyncio
-from dotenv import load_dotenv
+from src.utils.env import load_environment
+
+@dataclass(slots=True)
+class MarketFrame:
+    """Token history as contiguous float32 column arrays
+
+    Built once per fetch so strategies index ndarrays directly instead
+    of re-converting Python lists (or DataFrame columns) every tick.
+    """
+    close: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    volume: np.ndarray
+    price: float
+    timestamp: float
+
+    _COLUMNS = {'Close': 'close', 'High': 'high', 'Low': 'low', 'Volume': 'volume'}
+
+    def __getitem__(self, key):
+        # Dict-style access for code still using DataFrame column names
+        return getattr(self, self._COLUMNS.get(key, key))
+
+    @property
+    def empty(self) -> bool:
+        return self.close.size == 0
 
 class ChainStackClient:
     def __init__(self):
-        load_dotenv()
+        load_environment()
         base_url = os.getenv("RPC_ENDPOINT")
         if not base_url:
             raise ValueError("RPC_ENDPOINT environment variable is required")
@@ -61,6 +87,21 @@ class ChainStackClient:
             return float(response["result"]["value"]) / 1e9
         return 0.0
 
+    async def get_token_balance(self, token_address: str, wallet_address: str) -> float:
+        response = await asyncio.to_thread(
+            self._post_rpc,
+            "getTokenAccountsByOwner",
+            [wallet_address, {"mint": token_address}, {"encoding": "jsonParsed"}]
+        )
+        try:
+            accounts = response["result"]["value"]
+            return sum(
+                float(a["account"]["data"]["parsed"]["info"]["tokenAmount"]["uiAmount"] or 0)
+                for a in accounts
+            )
+        except (KeyError, IndexError, TypeError):
+            return 0.0
+
     def get_token_data(self, token_address: str, days_back: int = 3, timeframe: str = '1H') -> pd.DataFrame:
         response = self._post_rpc("getTokenLargestAccounts", [token_address])
         if "result" not in response or "value" not in response["result"]:
@@ -91,6 +132,21 @@ class ChainStackClient:
             
         return df
             
+    def get_token_frame(self, token_address: str, days_back: int = 3, timeframe: str = '1H') -> MarketFrame:
+        """Get token history as a MarketFrame of contiguous arrays"""
+        df = self.get_token_data(token_address, days_back, timeframe)
+        if df.empty:
+            empty = np.empty(0, dtype=np.float32)
+            return MarketFrame(empty, empty, empty, empty, 0.0, time.time())
+        return MarketFrame(
+            close=np.ascontiguousarray(df['Close'].values, dtype=np.float32),
+            high=np.ascontiguousarray(df['High'].values, dtype=np.float32),
+            low=np.ascontiguousarray(df['Low'].values, dtype=np.float32),
+            volume=np.ascontiguousarray(df['Volume'].values, dtype=np.float32),
+            price=float(df['Close'].values[-1]),
+            timestamp=time.time()
+        )
+
     def _calculate_rsi(self, prices: pd.Series, periods: int = 14) -> pd.Series:
         deltas = prices.diff()
         gain = (deltas.where(deltas.gt(0), 0)).rolling(window=periods).mean()
@@ -150,3 +206,17 @@ class ChainStackClient:
             except Exception as e:
                 cprint(f"❌ WebSocket connection error: {str(e)}", "red")
                 await asyncio.sleep(5)
+
+# Shared instance: every strategy and service reuses one client (and
+# its rate limiter) instead of each constructing its own. Built on
+# first use, not at import — __init__ raises without RPC_ENDPOINT and
+# importing this module must stay safe in environments (tests, tools)
+# that never touch the chain.
+_client: Optional[ChainStackClient] = None
+
+def get_client() -> ChainStackClient:
+    """Get the process-wide ChainStack client"""
+    global _client
+    if _client is None:
+        _client = ChainStackClient()
+    return _client
@@ -8,14 +8,14 @@ import pandas as pd
 from termcolor import cprint
 import websockets
 import asyncio
-from dotenv import load_dotenv
+from src.utils.env import load_environment
 
 class HeliusClient:
     """Client for interacting with Helius API"""
     
     def __init__(self):
         """Initialize Helius client with API key from environment"""
-        load_dotenv()
+        load_environment()
         self.api_key = os.getenv("HELIUS_API_KEY")
         if not self.api_key:
             raise ValueError("HELIUS_API_KEY environment variable is required")
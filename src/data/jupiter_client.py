@@ -1,6 +1,8 @@
 from typing import Dict, Optional
 import requests
 import json
+import orjson
+import threading
 import time
 import os
 from termcolor import cprint
@@ -23,7 +25,10 @@ class JupiterClient:
         if not base_url:
             raise ValueError("RPC_ENDPOINT environment variable is required")
         self.base_url = str(base_url)
-        
+        # Serialize swap submission so concurrent trades can't race the
+        # wallet nonce even when quotes are fetched in parallel
+        self._swap_lock = threading.Lock()
+
     def _rate_limit(self):
         """Implement rate limiting"""
         current_time = time.time()
@@ -32,7 +37,8 @@ class JupiterClient:
             time.sleep(self.min_request_interval - time_since_last)
         self.last_request_time = time.time()
         
-    def get_quote(self, input_mint: str, output_mint: str, amount: int) -> Optional[Dict]:
+    def get_quote(self, input_mint: str, output_mint: str, amount: int,
+                  only_direct_routes: bool = False) -> Optional[Dict]:
         """Get quote for token swap"""
         try:
             self._rate_limit()
@@ -44,15 +50,21 @@ class JupiterClient:
                 "slippageBps": self.slippage_bps,
                 "maxAccounts": 54
             }
+            if only_direct_routes:
+                params["onlyDirectRoutes"] = "true"
             response = requests.get(url, params=params)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             cprint(f"❌ Failed to get quote: {str(e)}", "red")
             return None
             
     def execute_swap(self, quote_response: Dict, wallet_pubkey: str) -> Optional[str]:
         """Execute swap transaction using Jupiter API"""
+        with self._swap_lock:
+            return self._execute_swap_locked(quote_response, wallet_pubkey)
+
+    def _execute_swap_locked(self, quote_response: Dict, wallet_pubkey: str) -> Optional[str]:
         try:
             self._rate_limit()
             url = f"{self.base_url}/swap"
@@ -68,9 +80,9 @@ class JupiterClient:
                 },
                 "dynamicComputeUnitLimit": True
             }
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = requests.post(url, headers=self.headers, data=orjson.dumps(payload))
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("swapTransaction")
         except Exception as e:
             cprint(f"❌ Failed to execute swap: {str(e)}", "red")
@@ -0,0 +1,110 @@
+"""
+Jupiter Client V2
+Async Jupiter V6 client holding one persistent pooled session
+"""
+
+import os
+from typing import Any, Dict, Optional
+import aiohttp
+import orjson
+from redis import asyncio as aioredis
+from termcolor import cprint
+
+# Shared with the web layer; quote bursts from many users land on the
+# same (input, output, amount) key within Jupiter's own refresh cadence
+redis_client = aioredis.from_url(
+    os.getenv("REDIS_URL", "redis://localhost:6379"),
+    decode_responses=False
+)
+QUOTE_CACHE_TTL = 3
+
+class JupiterClientV2:
+    def __init__(self):
+        self.base_url = "https://quote-api.jup.ag/v6"
+        self.sol_token = "So11111111111111111111111111111111111111112"
+        self.slippage_bps = 250
+        # The quote request shape is fixed; only three values vary per
+        # call. Pre-assemble the URLs and static params once instead of
+        # re-stringifying slippage and rebuilding dicts in the hot path.
+        self._quote_url = f"{self.base_url}/quote"
+        self._swap_url = f"{self.base_url}/swap"
+        self._quote_params_base = {
+            "slippageBps": str(self.slippage_bps),
+            "useSharedAccounts": "true"
+        }
+        # Created on first use and reused for every quote/swap; a session
+        # per request would re-handshake TLS to quote-api.jup.ag each time
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.cache_stats = {"hits": 0, "misses": 0}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the pooled session (call on application shutdown)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def get_quote(self, input_mint: str, output_mint: str, amount: str,
+                        use_shared_accounts: bool = True) -> Optional[Dict[str, Any]]:
+        """Get a swap quote from Jupiter V6, cached in Redis for a few seconds"""
+        cache_key = f"quote:{input_mint}:{output_mint}:{amount}:{self.slippage_bps}"
+        try:
+            cached = await redis_client.get(cache_key)
+            if cached:
+                self.cache_stats["hits"] += 1
+                return orjson.loads(cached)
+        except Exception:
+            pass
+        self.cache_stats["misses"] += 1
+        try:
+            session = await self._get_session()
+            params = {
+                **self._quote_params_base,
+                "inputMint": input_mint,
+                "outputMint": output_mint,
+                "amount": amount
+            }
+            if not use_shared_accounts:
+                params["useSharedAccounts"] = "false"
+            async with session.get(self._quote_url, params=params) as response:
+                response.raise_for_status()
+                quote = await response.json(loads=orjson.loads, content_type=None)
+            try:
+                await redis_client.setex(cache_key, QUOTE_CACHE_TTL, orjson.dumps(quote))
+            except Exception:
+                pass
+            return quote
+        except Exception as e:
+            cprint(f"❌ Failed to get Jupiter quote: {e}", "red")
+            return None
+
+    async def execute_swap(self, quote: Dict[str, Any], wallet_address: str) -> Optional[str]:
+        """Build and submit a swap for a previously fetched quote"""
+        try:
+            session = await self._get_session()
+            payload = {
+                "quoteResponse": quote,
+                "userPublicKey": wallet_address,
+                "wrapAndUnwrapSol": True
+            }
+            async with session.post(
+                self._swap_url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                response.raise_for_status()
+                data = await response.json(loads=orjson.loads, content_type=None)
+                return data.get("txid") or data.get("swapTransaction")
+        except Exception as e:
+            cprint(f"❌ Failed to execute swap: {e}", "red")
+            return None
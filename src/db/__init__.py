@@ -0,0 +1,4 @@
+"""
+Lumix DB
+Shared database clients
+"""
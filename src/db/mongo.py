@@ -0,0 +1,30 @@
+"""
+Shared MongoDB client
+One AsyncIOMotorClient for every service in the process
+"""
+
+import os
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorClient
+
+MONGO_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+
+_client: Optional[AsyncIOMotorClient] = None
+
+def get_client() -> AsyncIOMotorClient:
+    """Get the process-wide Motor client
+
+    Motor spins up a worker thread pool per client, so every service
+    holding its own client multiplies thread count and GIL contention;
+    all services share this one pooled client instead.
+    """
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient(
+            MONGO_URI,
+            maxPoolSize=200,
+            minPoolSize=20,
+            socketTimeoutMS=5000,
+            compressors="zstd"
+        )
+    return _client
@@ -0,0 +1,4 @@
+"""
+Lumix Modules
+Instruction parsing and token analysis helpers
+"""
@@ -0,0 +1,39 @@
+"""
+GUI Chat
+Minimal desktop chat window for driving the dialogue flow locally
+"""
+
+from PyQt6.QtWidgets import (
+    QLineEdit, QMainWindow, QPushButton, QTextEdit, QVBoxLayout, QWidget
+)
+from src.modules.nlp_processor import NLPProcessor
+
+class ChatWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Lumix Chat")
+        self.processor = NLPProcessor()
+
+        self.history = QTextEdit()
+        self.history.setReadOnly(True)
+        self.input_box = QLineEdit()
+        self.send_button = QPushButton("发送 | Send")
+        self.send_button.clicked.connect(self.send_message)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.history)
+        layout.addWidget(self.input_box)
+        layout.addWidget(self.send_button)
+        container = QWidget()
+        container.setLayout(layout)
+        self.setCentralWidget(container)
+
+    def send_message(self):
+        text = self.input_box.text().strip()
+        if not text:
+            return
+        self.history.append(f"> {text}")
+        result = self.processor.process_instruction(text)
+        if result["parameters"]:
+            self.history.append(f"参数 | parameters: {result['parameters']}")
+        self.input_box.clear()
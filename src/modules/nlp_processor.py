@@ -0,0 +1,53 @@
+"""
+NLP Processor
+Extracts structured trade parameters from model replies
+"""
+
+import json
+import re
+from typing import Any, Dict
+import orjson
+
+# Compiled once at import; per-call re.search pays a cache lookup and
+# argument parse even when the pattern is cached
+_CONF_HIGH = re.compile(r"确定|肯定|definitely|certain|立即|immediately")
+_CONF_MED = re.compile(r"应该|建议|should|recommend|likely")
+
+def _fast_json_loads(payload: str) -> Any:
+    """Decode JSON with the cheaper parser for the payload's size
+
+    orjson wins clearly on larger documents, but for tiny blobs the
+    str->bytes hop makes stdlib json comparable — dispatch on length.
+    """
+    if len(payload) >= 512:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+class NLPProcessor:
+    def process_instruction(self, content: str) -> Dict[str, Any]:
+        """Parameters plus a confidence grade for a model reply"""
+        parameters = self._extract_parameters(content)
+        return {
+            "parameters": parameters,
+            "confidence": self._estimate_confidence(content) if parameters else "low"
+        }
+
+    def _extract_parameters(self, content: str) -> Dict[str, Any]:
+        """Pull the first JSON object out of a model reply"""
+        start = content.find("{")
+        end = content.rfind("}")
+        if start == -1 or end <= start:
+            return {}
+        try:
+            parameters = _fast_json_loads(content[start:end + 1])
+        except Exception:
+            return {}
+        return parameters if isinstance(parameters, dict) else {}
+
+    def _estimate_confidence(self, content: str) -> str:
+        """Grade how certain the model reply reads"""
+        if _CONF_HIGH.search(content):
+            return "high"
+        if _CONF_MED.search(content):
+            return "medium"
+        return "low"
@@ -0,0 +1,4 @@
+"""
+Lumix Monitoring
+System health and trading performance collectors
+"""
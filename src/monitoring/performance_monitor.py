@@ -0,0 +1,32 @@
+"""
+Performance Monitor
+Aggregates trade outcomes across all instances
+"""
+
+import time
+from typing import Dict
+
+class PerformanceMonitor:
+    def __init__(self):
+        self.total_trades = 0
+        self.successful_trades = 0
+        self.total_volume_sol = 0.0
+        self._started_at = time.time()
+
+    def record_trade(self, success: bool, amount_sol: float):
+        """Record a single trade outcome"""
+        self.total_trades += 1
+        if success:
+            self.successful_trades += 1
+            self.total_volume_sol += amount_sol
+
+    def get_summary(self) -> Dict:
+        """Summarize trading performance since startup"""
+        uptime = time.time() - self._started_at
+        return {
+            "total_trades": self.total_trades,
+            "successful_trades": self.successful_trades,
+            "success_rate": self.successful_trades / self.total_trades if self.total_trades else 0.0,
+            "total_volume_sol": self.total_volume_sol,
+            "uptime_seconds": uptime
+        }
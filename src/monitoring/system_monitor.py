@@ -0,0 +1,28 @@
+"""
+System Monitor
+Process and host health checks for the trading services
+"""
+
+import psutil
+
+class SystemMonitor:
+    def __init__(self):
+        self.cpu_threshold = 90.0
+        self.memory_threshold = 90.0
+        self.disk_threshold = 95.0
+
+    def check_system_health(self) -> dict:
+        """Sample host CPU/memory/disk usage and flag threshold breaches"""
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        return {
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory.percent,
+            "disk_percent": disk.percent,
+            "healthy": (
+                cpu_percent < self.cpu_threshold
+                and memory.percent < self.memory_threshold
+                and disk.percent < self.disk_threshold
+            )
+        }
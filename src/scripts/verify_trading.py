@@ -1,94 +1,277 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
 import time
 from datetime import datetime, timedelta
-import requests
-from termcolor import cprint
-import pandas as pd
-from src.data.chainstack_client import ChainStackClient
+import aiohttp
+import orjson
+import websockets
+from termcolor import colored
+from src.data.jupiter_client import JupiterClient
 
-def verify_trading(duration_hours=2, wallet_address="4BKPzFyjBaRP3L1PNDf3xTerJmbbxxESmDmZJ2CZYdQ5"):
+class ColorFormatter(logging.Formatter):
+    """Apply terminal color once per record instead of per cprint call"""
+    COLORS = {logging.WARNING: "yellow", logging.ERROR: "red"}
+
+    def format(self, record):
+        message = super().format(record)
+        color = self.COLORS.get(record.levelno)
+        return colored(message, color) if color else message
+
+class RateLimitFilter(logging.Filter):
+    """Emit records marked periodic=True at most once per interval"""
+
+    def __init__(self, interval: float = 300.0):
+        super().__init__()
+        self.interval = interval
+        self._last_emit = 0.0
+
+    def filter(self, record):
+        if not getattr(record, "periodic", False):
+            return True
+        now = time.monotonic()
+        if now - self._last_emit < self.interval:
+            return False
+        self._last_emit = now
+        return True
+
+log = logging.getLogger("verify_trading")
+if not log.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(ColorFormatter("%(message)s"))
+    log.addHandler(_handler)
+    log.addFilter(RateLimitFilter())
+    log.setLevel(logging.INFO)
+
+SOL_TOKEN = "So11111111111111111111111111111111111111112"
+AI16Z_TOKEN = "HeLp6NuQkmYB4pYWo2zYs22mESHXPQYzXbB8n4V98jwC"
+SWARM_TOKEN = "74SBV4zDXxTRgv1pEMoECskKBkZHc2yGPnc7GYVepump"
+TEST_TRADE_AMOUNT_SOL = 0.001
+SOLSCAN_URL = "https://public-api.solscan.io"
+
+# Capture env once at import so the per-trade hot path doesn't re-walk
+# os.environ, and so the balance payload can be built a single time
+WALLET = os.getenv("WALLET_ADDRESS", "")
+RPC = os.getenv("RPC_ENDPOINT", "")
+BALANCE_PAYLOAD = orjson.dumps(
+    {"jsonrpc": "2.0", "id": "get-balance", "method": "getBalance", "params": [WALLET]}
+)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+async def get_wallet_balance(session: aiohttp.ClientSession, wallet_address: str = "") -> float:
+    """Get wallet SOL balance via the Chainstack RPC endpoint"""
+    if wallet_address and wallet_address != WALLET:
+        body = orjson.dumps(
+            {"jsonrpc": "2.0", "id": "get-balance", "method": "getBalance", "params": [wallet_address]}
+        )
+    else:
+        body = BALANCE_PAYLOAD
+    async with session.post(RPC, data=body, headers=JSON_HEADERS) as response:
+        data = orjson.loads(await response.read())
+    if "result" in data and "value" in data["result"]:
+        return float(data["result"]["value"]) / 1e9
+    return 0.0
+
+async def wait_for_confirmation(signature: str, client: JupiterClient, timeout: float = 60.0) -> bool:
+    """Await the confirmed notification for a signature over WebSocket
+
+    Subscribing to signatureSubscribe means the node pushes the
+    confirmation as soon as it lands instead of us sleeping a fixed
+    5/30/60s and re-polling getSignatureStatuses. Falls back to the
+    polling monitor if the WS endpoint is unavailable.
+    """
+    ws_url = os.getenv("RPC_WS_ENDPOINT") or RPC.replace("https://", "wss://")
+    try:
+        async with websockets.connect(ws_url) as ws:
+            await ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "signatureSubscribe",
+                "params": [signature, {"commitment": "confirmed"}]
+            }))
+            deadline = asyncio.get_event_loop().time() + timeout
+            while True:
+                remaining = deadline - asyncio.get_event_loop().time()
+                if remaining <= 0:
+                    log.error(f"❌ Confirmation timed out for {signature[:8]}...")
+                    return False
+                message = json.loads(await asyncio.wait_for(ws.recv(), timeout=remaining))
+                if message.get("method") != "signatureNotification":
+                    continue
+                result = message.get("params", {}).get("result", {})
+                err = result.get("value", {}).get("err")
+                if err:
+                    log.error(f"❌ Transaction {signature[:8]}... failed: {err}")
+                    return False
+                log.info(f"✅ Transaction {signature[:8]}... confirmed")
+                return True
+    except Exception as e:
+        log.warning(f"⚠️ WebSocket confirmation unavailable ({e}), falling back to polling")
+        return await asyncio.to_thread(client.monitor_transaction, signature)
+
+async def execute_trade(session: aiohttp.ClientSession, client: JupiterClient,
+                        input_token: str, output_token: str, amount_sol: float,
+                        check_balance: bool = True) -> bool:
+    """Execute a single test swap and wait for confirmation"""
+    try:
+        if check_balance:
+            balance = await get_wallet_balance(session)
+            if balance < amount_sol:
+                log.error(f"❌ Insufficient balance: {balance:.6f} SOL")
+                return False
+        amount_lamports = int(amount_sol * 1e9)
+        # JupiterClient is still synchronous, so keep its calls off the loop
+        quote = await asyncio.to_thread(client.get_quote, input_token, output_token, amount_lamports)
+        if not quote:
+            return False
+        if len(quote.get("routePlan", [])) > 2:
+            # Retry with a materially different parameter — re-requesting the
+            # same quote would just burn another Jupiter round trip
+            log.warning("⚠️ Route too complex, retrying with direct routes only")
+            quote = await asyncio.to_thread(
+                client.get_quote, input_token, output_token, amount_lamports, True
+            )
+            if not quote:
+                return False
+        signature = await asyncio.to_thread(client.execute_swap, quote, WALLET)
+        if not signature:
+            return False
+        return await wait_for_confirmation(signature, client)
+    except Exception as e:
+        log.error(f"❌ Trade failed: {e}")
+        return False
+
+async def verify_trading(session: aiohttp.ClientSession, duration_hours=2,
+                         wallet_address="4BKPzFyjBaRP3L1PNDf3xTerJmbbxxESmDmZJ2CZYdQ5"):
     start_time = datetime.now()
     end_time = start_time + timedelta(hours=duration_hours)
-    
-    cprint(f"\n🔍 Starting trading verification for {wallet_address}", "cyan")
-    cprint(f"📅 Verifying from {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}\n", "cyan")
-    
-    client = ChainStackClient()
+    # Schedule off the monotonic clock; datetime.now() is only built for
+    # the user-facing log lines
+    end_monotonic = time.monotonic() + duration_hours * 3600
+
+    log.info(f"\n🔍 Starting trading verification for {wallet_address}")
+    log.info(f"📅 Verifying from {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+
     trades_verified = 0
     total_volume = 0
-    
-    while datetime.now() < end_time:
+
+    while time.monotonic() < end_monotonic:
         try:
-            # Get wallet balance
-            sol_balance = client.get_wallet_balance(wallet_address)
-            cprint(f"Current SOL Balance: {sol_balance:.6f} SOL", "cyan")
-            
+            sol_balance = await get_wallet_balance(session, wallet_address)
+            log.info(f"Current SOL Balance: {sol_balance:.6f} SOL", extra={"periodic": True})
+
             # Check Solscan for recent transactions
-            response = requests.get(
-                f"https://public-api.solscan.io/account/transactions",
+            async with session.get(
+                f"{SOLSCAN_URL}/account/transactions",
                 params={"account": wallet_address, "limit": 10},
                 headers={"accept": "application/json"}
-            )
-            
-            if response.status_code == 200:
-                transactions = response.json()
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                for tx in transactions:
-                    tx_hash = tx.get('txHash', '')
-                    
-                    # Get detailed transaction info
-                    tx_response = requests.get(
-                        f"https://public-api.solscan.io/transaction/{tx_hash}",
-                        headers={"accept": "application/json"}
-                    )
-                    
-                    if tx_response.status_code == 200:
-                        tx_details = tx_response.json()
-                        status = tx_details.get("status") == "Success"
-                        fee = tx_details.get("fee", 0) / 1e9
-                        
-                        # Verify Jupiter swap
-                        is_swap = False
-                        swap_amount = 0
-                        for log in tx_details.get("logMessages", []):
-                            if "Program log: Instruction: Swap" in log:
-                                is_swap = True
-                                # Extract swap amount from logs if possible
-                                try:
-                                    amount_str = log.split("amount: ")[1].split()[0]
-                                    swap_amount = float(amount_str) / 1e6  # Convert from lamports
-                                except:
-                                    pass
-                        
-                        if is_swap and status:
-                            trades_verified += 1
-                            total_volume += swap_amount
-                            cprint(f"\n[{current_time}] ✅ Verified Trade:", "green")
-                            cprint(f"  Transaction: {tx_hash}", "cyan")
-                            cprint(f"  Amount: {swap_amount:.2f} USDC", "cyan")
-                            cprint(f"  Fee: {fee:.6f} SOL", "cyan")
-                            cprint(f"  View: https://solscan.io/tx/{tx_hash}", "cyan")
-                        elif is_swap:
-                            cprint(f"\n[{current_time}] ❌ Failed Trade:", "red")
-                            cprint(f"  Transaction: {tx_hash}", "red")
-                            cprint(f"  View: https://solscan.io/tx/{tx_hash}", "red")
-            
-            time.sleep(60)
-            
+            ) as response:
+                if response.status != 200:
+                    await asyncio.sleep(60)
+                    continue
+                transactions = await response.json()
+
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            for tx in transactions:
+                tx_hash = tx.get('txHash', '')
+
+                # Get detailed transaction info
+                async with session.get(
+                    f"{SOLSCAN_URL}/transaction/{tx_hash}",
+                    headers={"accept": "application/json"}
+                ) as tx_response:
+                    if tx_response.status != 200:
+                        continue
+                    tx_details = await tx_response.json()
+
+                status = tx_details.get("status") == "Success"
+                fee = tx_details.get("fee", 0) / 1e9
+
+                # Verify Jupiter swap
+                is_swap = False
+                swap_amount = 0
+                for log_line in tx_details.get("logMessages", []):
+                    if "Program log: Instruction: Swap" in log_line:
+                        is_swap = True
+                        # Extract swap amount from logs if possible
+                        try:
+                            amount_str = log_line.split("amount: ")[1].split()[0]
+                            swap_amount = float(amount_str) / 1e6  # Convert from lamports
+                        except:
+                            pass
+
+                if is_swap and status:
+                    trades_verified += 1
+                    total_volume += swap_amount
+                    log.info(f"\n[{current_time}] ✅ Verified Trade:")
+                    log.info(f"  Transaction: {tx_hash}")
+                    log.info(f"  Amount: {swap_amount:.2f} USDC")
+                    log.info(f"  Fee: {fee:.6f} SOL")
+                    log.info(f"  View: https://solscan.io/tx/{tx_hash}")
+                elif is_swap:
+                    log.error(f"\n[{current_time}] ❌ Failed Trade:")
+                    log.error(f"  Transaction: {tx_hash}")
+                    log.error(f"  View: https://solscan.io/tx/{tx_hash}")
+
+            await asyncio.sleep(60)
+
         except Exception as e:
-            cprint(f"❌ Error verifying trades: {e}", "red")
-            time.sleep(10)
-    
-    cprint("\n📊 Trading Verification Summary:", "cyan")
-    cprint(f"✅ Verified Trades: {trades_verified}", "green")
-    cprint(f"💰 Total Volume: {total_volume:.2f} USDC", "green")
-    cprint(f"⏱️ Duration: {duration_hours} hours", "cyan")
-    cprint(f"🔍 Monitored from {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "cyan")
+            log.error(f"❌ Error verifying trades: {e}")
+            await asyncio.sleep(10)
+
+    log.info("\n📊 Trading Verification Summary:")
+    log.info(f"✅ Verified Trades: {trades_verified}")
+    log.info(f"💰 Total Volume: {total_volume:.2f} USDC")
+    log.info(f"⏱️ Duration: {duration_hours} hours")
+    log.info(f"🔍 Monitored from {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Execute the test trades and verify them on-chain")
+    parser.add_argument("--ai16z-token", default=AI16Z_TOKEN, help="Output mint for the first test trade")
+    parser.add_argument("--swarm-token", default=SWARM_TOKEN, help="Output mint for the second test trade")
+    parser.add_argument("--amount-sol", type=float, default=TEST_TRADE_AMOUNT_SOL, help="SOL amount per test trade")
+    parser.add_argument("--with-balance-check", action="store_true", help="Pre-check the wallet balance before each trade")
+    parser.add_argument("--inter-trade-sleep", type=float, default=0.0,
+                        help="Seconds to wait between trades; 0 dispatches them concurrently")
+    parser.add_argument("--duration-hours", type=float, default=2.0, help="How long to verify after trading")
+    return parser.parse_args(argv)
+
+async def main(args=None):
+    """Fire the two independent test trades, then verify"""
+    if args is None:
+        args = parse_args()
+    if not WALLET or not RPC:
+        raise ValueError("WALLET_ADDRESS and RPC_ENDPOINT environment variables are required")
+    client = JupiterClient()
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tokens = (args.ai16z_token, args.swarm_token)
+        if args.inter_trade_sleep > 0:
+            results = []
+            for token in tokens:
+                results.append(await execute_trade(
+                    session, client, SOL_TOKEN, token, args.amount_sol, args.with_balance_check
+                ))
+                if token is not tokens[-1]:
+                    await asyncio.sleep(args.inter_trade_sleep)
+        else:
+            # The two trades are data-independent, so one event loop
+            # multiplexes both RPC round trips; execute_swap is serialized
+            # internally so the wallet nonce can't race
+            results = await asyncio.gather(*(
+                execute_trade(session, client, SOL_TOKEN, token, args.amount_sol, args.with_balance_check)
+                for token in tokens
+            ))
+        log.info(f"📊 Test trades completed: {sum(results)}/{len(results)} succeeded")
+        await verify_trading(session, duration_hours=args.duration_hours)
 
 if __name__ == "__main__":
     try:
-        verify_trading()
+        asyncio.run(main())
     except KeyboardInterrupt:
-        cprint("\n👋 Verification stopped by user", "yellow")
+        log.warning("\n👋 Verification stopped by user")
     except Exception as e:
-        cprint(f"\n❌ Fatal error: {e}", "red")
+        log.error(f"\n❌ Fatal error: {e}")
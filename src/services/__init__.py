@@ -0,0 +1,4 @@
+"""
+Lumix Services
+Shared service layer for the trading system
+"""
@@ -0,0 +1,104 @@
+"""
+Balance Manager
+Tracks per-instance balance allocations and the wallet SOL balance
+"""
+
+import os
+import time
+from decimal import Decimal
+from typing import Dict, Optional
+from termcolor import cprint
+from src.data.chainstack_client import ChainStackClient
+
+# Allocations are stored as integer parts-per-million so the hot path is
+# native int add/compare instead of Decimal arithmetic; Decimal only
+# appears at the public API boundary
+PPM = 1_000_000
+
+def _to_ppm(percentage) -> int:
+    return int(Decimal(str(percentage)) * PPM)
+
+class BalanceManager:
+    def __init__(self):
+        self.instance_allocations: Dict[str, int] = {}  # instance_id -> ppm
+        self.min_allocation = 1_000    # 0.1% minimum
+        self.max_allocation = 500_000  # 50% maximum per instance
+        # Running total so allocate/update/available stay O(1) instead of
+        # re-summing every allocation on each call
+        self._total_ppm = 0
+        self.client = ChainStackClient()
+        self.wallet_address = os.getenv("WALLET_ADDRESS", "")
+        # TTL cache for the wallet SOL balance so bursts of REST polling
+        # don't turn into one RPC call each
+        self._balance_cache: Optional[float] = None
+        self._balance_cached_at = 0.0
+        self._balance_ttl = 5.0  # seconds
+
+    def get_sol_balance(self) -> float:
+        """Get wallet SOL balance, cached for a short TTL"""
+        now = time.monotonic()
+        if self._balance_cache is not None and now - self._balance_cached_at < self._balance_ttl:
+            return self._balance_cache
+        balance = self.client.get_wallet_balance(self.wallet_address)
+        self._balance_cache = balance
+        self._balance_cached_at = now
+        return balance
+
+    def allocate_balance(self, instance_id: str, percentage) -> bool:
+        """Allocate a percentage of the wallet balance to an instance"""
+        ppm = _to_ppm(percentage)
+        if ppm < self.min_allocation or ppm > self.max_allocation:
+            cprint(f"❌ Allocation {percentage} outside [{self.min_allocation / PPM}, {self.max_allocation / PPM}]", "red")
+            return False
+        if instance_id in self.instance_allocations:
+            cprint(f"❌ Instance {instance_id} already has an allocation", "red")
+            return False
+        if self._total_ppm + ppm > PPM:
+            cprint(f"❌ Allocation would exceed 100% (current {self._total_ppm / 10_000}%)", "red")
+            return False
+        self.instance_allocations[instance_id] = ppm
+        self._total_ppm += ppm
+        return True
+
+    def update_allocation(self, instance_id: str, percentage) -> bool:
+        """Update an existing instance allocation"""
+        current = self.instance_allocations.get(instance_id)
+        if current is None:
+            cprint(f"❌ Unknown instance {instance_id}", "red")
+            return False
+        ppm = _to_ppm(percentage)
+        if ppm < self.min_allocation or ppm > self.max_allocation:
+            cprint(f"❌ Allocation {percentage} outside [{self.min_allocation / PPM}, {self.max_allocation / PPM}]", "red")
+            return False
+        if self._total_ppm - current + ppm > PPM:
+            cprint(f"❌ Allocation would exceed 100%", "red")
+            return False
+        self.instance_allocations[instance_id] = ppm
+        self._total_ppm += ppm - current
+        return True
+
+    def remove_allocation(self, instance_id: str) -> bool:
+        """Remove an instance allocation"""
+        if instance_id not in self.instance_allocations:
+            return False
+        self._total_ppm -= self.instance_allocations[instance_id]
+        del self.instance_allocations[instance_id]
+        return True
+
+    def get_allocation(self, instance_id: str) -> Optional[Decimal]:
+        """Get the allocation for a single instance as a fraction"""
+        ppm = self.instance_allocations.get(instance_id)
+        if ppm is None:
+            return None
+        return Decimal(ppm) / PPM
+
+    def get_available_allocation(self) -> Decimal:
+        """Get the unallocated fraction of the wallet balance"""
+        return Decimal(PPM - self._total_ppm) / PPM
+
+    def get_instance_balance(self, instance_id: str) -> float:
+        """Get the SOL balance allocated to an instance"""
+        ppm = self.instance_allocations.get(instance_id)
+        if ppm is None:
+            return 0.0
+        return self.get_sol_balance() * ppm / PPM
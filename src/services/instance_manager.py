@@ -0,0 +1,228 @@
+"""
+Instance Manager
+Creates and tracks independent trading instances, each with its own
+token list, parameters and balance allocation
+"""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+from termcolor import cprint
+from src.data.jupiter_client import JupiterClient
+from src.monitoring.performance_monitor import PerformanceMonitor
+from src.monitoring.system_monitor import SystemMonitor
+from src.services.balance_manager import BalanceManager
+
+SOL_TOKEN = "So11111111111111111111111111111111111111112"
+
+class InstanceMetrics(BaseModel):
+    total_trades: int = 0
+    successful_trades: int = 0
+    failed_trades: int = 0
+    total_volume_sol: float = 0.0
+    last_trade_at: Optional[float] = None
+
+class TradeRequest(BaseModel):
+    input_token: str = SOL_TOKEN
+    output_token: str = ""
+    amount_sol: float = 0.0
+    slippage_bps: int = 250
+    use_shared_accounts: bool = True
+    force_simpler_route: bool = False
+
+class TradingInstance(BaseModel):
+    id: str
+    name: str
+    description: str = ""
+    strategy_id: str = ""
+    tokens: List[str] = []
+    amount_sol: float = 0.0
+    parameters: Dict[str, Any] = {}
+    active: bool = True
+    metrics: InstanceMetrics
+
+class InstanceAgent:
+    """Per-instance trade executor backed by the shared Jupiter API"""
+
+    def __init__(self, instance_id: str, wallet_address: str):
+        self.instance_id = instance_id
+        self.wallet_address = wallet_address
+        self.client = JupiterClient()
+
+    def execute_trade(self, trade_request: TradeRequest) -> bool:
+        amount_lamports = int(trade_request.amount_sol * 1e9)
+        quote = self.client.get_quote(
+            trade_request.input_token,
+            trade_request.output_token,
+            amount_lamports,
+            only_direct_routes=trade_request.force_simpler_route
+        )
+        if not quote:
+            return False
+        signature = self.client.execute_swap(quote, self.wallet_address)
+        if not signature:
+            return False
+        return self.client.monitor_transaction(signature)
+
+def validate_instance_config(config: Dict[str, Any]) -> Optional[str]:
+    """Validate an instance config once, up front"""
+    if not config.get("name"):
+        return "name is required"
+    if not isinstance(config.get("tokens", []), list):
+        return "tokens must be a list"
+    try:
+        float(config.get("amount_sol", 0.0))
+    except (TypeError, ValueError):
+        return "amount_sol must be numeric"
+    if not isinstance(config.get("parameters", {}), dict):
+        return "parameters must be a dict"
+    return None
+
+def _build_trade_template(parameters: Dict[str, Any]) -> TradeRequest:
+    """Build the per-instance TradeRequest template once at creation"""
+    return TradeRequest.model_construct(
+        input_token=SOL_TOKEN,
+        output_token="",
+        amount_sol=0.0,
+        slippage_bps=parameters.get("slippage_bps", 250),
+        use_shared_accounts=parameters.get("use_shared_accounts", True),
+        force_simpler_route=parameters.get("force_simpler_route", False)
+    )
+
+@dataclass(slots=True)
+class InstanceBundle:
+    instance: TradingInstance
+    agent: InstanceAgent
+    trade_template: TradeRequest
+
+class InstanceManager:
+    def __init__(self):
+        # One dict keyed by instance id holding (instance, agent) bundles,
+        # so metric reads and trades do a single hash-and-probe instead of
+        # paired lookups in separate instances/agents dicts
+        self._bundles: Dict[str, InstanceBundle] = {}
+        self.balance_manager = BalanceManager()
+        self.system_monitor = SystemMonitor()
+        self.performance_monitor = PerformanceMonitor()
+        # Both collectors are global, not per-instance, so scraping metrics
+        # for N instances should not recompute them N times; cache each
+        # behind a short TTL
+        self._health_cache = (0.0, None)
+        self._perf_cache = (0.0, None)
+        self._monitor_ttl = 1.0  # seconds
+
+    def _cached_health(self) -> Dict[str, Any]:
+        cached_at, value = self._health_cache
+        now = time.monotonic()
+        if value is None or now - cached_at > self._monitor_ttl:
+            value = self.system_monitor.check_system_health()
+            self._health_cache = (now, value)
+        return value
+
+    def _cached_perf(self) -> Dict[str, Any]:
+        cached_at, value = self._perf_cache
+        now = time.monotonic()
+        if value is None or now - cached_at > self._monitor_ttl:
+            value = self.performance_monitor.get_summary()
+            self._perf_cache = (now, value)
+        return value
+
+    def create_instance(self, config: Dict[str, Any]) -> Optional[TradingInstance]:
+        """Create a trading instance from a validated config"""
+        error = validate_instance_config(config)
+        if error:
+            cprint(f"❌ Invalid instance config: {error}", "red")
+            return None
+        instance_id = str(uuid.uuid4())
+        # The config was validated once above, so skip Pydantic's
+        # field-by-field validator dispatch with model_construct; this is
+        # the hot path when restoring many instances from storage
+        instance = TradingInstance.model_construct(
+            id=instance_id,
+            name=config["name"],
+            description=config.get("description", ""),
+            strategy_id=config.get("strategy_id", ""),
+            tokens=list(config.get("tokens", [])),
+            amount_sol=float(config.get("amount_sol", 0.0)),
+            parameters=config.get("parameters", {}),
+            active=True,
+            metrics=InstanceMetrics.model_construct(
+                total_trades=0, successful_trades=0, failed_trades=0,
+                total_volume_sol=0.0, last_trade_at=None
+            )
+        )
+        agent = InstanceAgent(instance_id, self.balance_manager.wallet_address)
+        self._bundles[instance_id] = InstanceBundle(
+            instance, agent, _build_trade_template(instance.parameters)
+        )
+        return instance
+
+    def register_instance(self, instance: TradingInstance) -> bool:
+        """Register an already-built TradingInstance"""
+        if instance.id in self._bundles:
+            cprint(f"❌ Instance {instance.id} already registered", "red")
+            return False
+        agent = InstanceAgent(instance.id, self.balance_manager.wallet_address)
+        self._bundles[instance.id] = InstanceBundle(
+            instance, agent, _build_trade_template(instance.parameters)
+        )
+        return True
+
+    def get_instance(self, instance_id: str) -> Optional[TradingInstance]:
+        bundle = self._bundles.get(instance_id)
+        return bundle.instance if bundle else None
+
+    def list_instances(self) -> List[TradingInstance]:
+        return [bundle.instance for bundle in self._bundles.values()]
+
+    def delete_instance(self, instance_id: str) -> bool:
+        if instance_id not in self._bundles:
+            return False
+        self.balance_manager.remove_allocation(instance_id)
+        del self._bundles[instance_id]
+        return True
+
+    def update_instance_metrics(self, instance_id: str, success: bool, amount_sol: float):
+        """Record a completed trade against an instance"""
+        bundle = self._bundles.get(instance_id)
+        if bundle is None:
+            return
+        metrics = bundle.instance.metrics
+        metrics.total_trades += 1
+        if success:
+            metrics.successful_trades += 1
+            metrics.total_volume_sol += amount_sol
+        else:
+            metrics.failed_trades += 1
+        metrics.last_trade_at = time.time()
+
+    def get_instance_metrics(self, instance_id: str) -> Optional[Dict[str, Any]]:
+        """Get trade metrics for an instance"""
+        bundle = self._bundles.get(instance_id)
+        if bundle is None:
+            return None
+        return {
+            "instance_id": instance_id,
+            "metrics": bundle.instance.metrics.model_dump(),
+            "active": bundle.instance.active,
+            "system_health": self._cached_health(),
+            "performance": self._cached_perf()
+        }
+
+    async def execute_instance_trade(self, instance_id: str, token: str, amount_sol: float) -> bool:
+        """Execute a trade on behalf of an instance"""
+        bundle = self._bundles.get(instance_id)
+        if bundle is None or not bundle.instance.active:
+            return False
+        # The template is built once per instance-config change; only the
+        # two per-trade fields are replaced here
+        trade_request = bundle.trade_template.model_copy(
+            update={"output_token": token, "amount_sol": amount_sol}
+        )
+        success = await asyncio.to_thread(bundle.agent.execute_trade, trade_request)
+        self.update_instance_metrics(instance_id, success, amount_sol)
+        self.performance_monitor.record_trade(success, amount_sol)
+        return success
@@ -0,0 +1,261 @@
+"""
+Logging Service
+Persists user actions and errors to MongoDB, Redis and a rotating file log
+"""
+
+import asyncio
+import atexit
+import functools
+import logging
+import msgpack
+import orjson
+import os
+import queue
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional
+import redis.asyncio as aioredis
+from termcolor import cprint
+from src.db.mongo import get_client
+
+class _TellRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler whose rollover check reads the stream position
+
+    The stock shouldRollover formats the record a second time just to
+    measure it; the current file offset is a good enough size signal.
+    """
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            return self.stream.tell() >= self.maxBytes
+        return False
+
+class LoggingService:
+    def __init__(self):
+        self.client = get_client()
+        self.db = self.client.lumixd
+        self.user_logs = self.db.user_logs
+        self.redis_client = aioredis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379"),
+            max_connections=64,
+            socket_keepalive=True,
+            health_check_interval=30
+        )
+
+        os.makedirs("logs", exist_ok=True)
+        handler = _TellRotatingFileHandler("logs/user_actions.log", maxBytes=10 * 1024 * 1024, backupCount=5)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        self.file_logger = logging.getLogger("user_actions")
+        if not self.file_logger.handlers:
+            # The event loop only pays for an enqueue; the listener thread
+            # does the formatting, size check and disk write
+            log_queue: queue.Queue = queue.Queue(-1)
+            self.file_logger.addHandler(QueueHandler(log_queue))
+            self.file_logger.setLevel(logging.INFO)
+            self._queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+            self._queue_listener.start()
+            atexit.register(self._queue_listener.stop)
+
+        # Log events are buffered here and drained by a background writer
+        # that issues one insert_many per batch instead of one insert_one
+        # round trip per event
+        self._mongo_queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+        self._mongo_writer_task: Optional[asyncio.Task] = None
+        self._mongo_batch_size = 500
+        self._mongo_flush_interval = 0.05  # seconds
+
+        # Back-pressure cap for fire-and-forget logging tasks
+        self._inflight = 0
+        self._max_inflight = 1000
+
+    def _ensure_writer(self):
+        if self._mongo_writer_task is None or self._mongo_writer_task.done():
+            self._mongo_writer_task = asyncio.create_task(self._mongo_writer())
+
+    async def _mongo_writer(self):
+        """Drain queued log entries and insert them in batches"""
+        while True:
+            batch = [await self._mongo_queue.get()]
+            deadline = time.monotonic() + self._mongo_flush_interval
+            while len(batch) < self._mongo_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._mongo_queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self.user_logs.insert_many(batch, ordered=False)
+            except Exception as e:
+                cprint(f"❌ Failed to write log batch to MongoDB: {e}", "red")
+
+    async def flush(self):
+        """Flush any queued log entries (call on shutdown)"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._mongo_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if batch:
+            try:
+                await self.user_logs.insert_many(batch, ordered=False)
+            except Exception as e:
+                cprint(f"❌ Failed to flush log batch to MongoDB: {e}", "red")
+
+    # Compiled once; the per-key Python loop over the sensitive-word list
+    # was a visible cost on deep trade-result payloads
+    _SENSITIVE_RE = re.compile(r'private_key|wallet_key|secret|password|key', re.IGNORECASE)
+    # Log dicts reuse the same key strings over and over (order_id,
+    # signature, ...), so verdicts are memoized and most keys cost one
+    # dict probe instead of a regex scan
+    _key_verdicts: Dict[str, bool] = {}
+
+    # Bound once so the hot path skips re-resolving the default= handler
+    # on every call
+    _encode = staticmethod(functools.partial(orjson.dumps, default=str))
+    # Redis entries travel as msgpack: binary, smaller than JSON text for
+    # typical log dicts, and native datetime support both ways. default=
+    # mirrors the orjson encoder — an unpackable value (Decimal, UUID, ...)
+    # must degrade to a string, not blow up all three sinks
+    _pack = staticmethod(functools.partial(msgpack.packb, use_bin_type=True, datetime=True,
+                                           default=str))
+    _unpack = staticmethod(functools.partial(msgpack.unpackb, raw=False, timestamp=3))
+
+    def _sanitize_data(self, data: Any) -> Any:
+        """Redact sensitive keys and truncate long strings
+
+        Walks the payload with an explicit work stack instead of
+        recursing, so deep payloads pay no call overhead and can't hit
+        the recursion limit.
+        """
+        if isinstance(data, str):
+            return data[:256] + "..." if len(data) > 256 else data
+        if not isinstance(data, (dict, list)):
+            return data
+        search = self._SENSITIVE_RE.search
+        verdicts = self._key_verdicts
+        root: Any = {} if isinstance(data, dict) else []
+        stack = deque([(data, root)])
+        while stack:
+            src, dst = stack.pop()
+            if isinstance(src, dict):
+                for key, value in src.items():
+                    sensitive = verdicts.get(key)
+                    if sensitive is None and isinstance(key, str):
+                        sensitive = search(key) is not None
+                        if len(verdicts) < 4096:
+                            verdicts[key] = sensitive
+                    if sensitive:
+                        dst[key] = "[REDACTED]"
+                    elif isinstance(value, (dict, list)):
+                        child: Any = {} if isinstance(value, dict) else []
+                        dst[key] = child
+                        stack.append((value, child))
+                    elif isinstance(value, str) and len(value) > 256:
+                        dst[key] = value[:256] + "..."
+                    else:
+                        dst[key] = value
+            else:
+                for value in src:
+                    if isinstance(value, (dict, list)):
+                        child = {} if isinstance(value, dict) else []
+                        dst.append(child)
+                        stack.append((value, child))
+                    elif isinstance(value, str) and len(value) > 256:
+                        dst.append(value[:256] + "...")
+                    else:
+                        dst.append(value)
+        return root
+
+    async def log_user_action(self, action: str, data: Dict[str, Any], user_id: str = "anonymous"):
+        """Log a user action to MongoDB, Redis and the file log"""
+        log_entry = {
+            "action": action,
+            "user_id": user_id,
+            "data": self._sanitize_data(data),
+            "timestamp": datetime.now(timezone.utc)
+        }
+        # Two codecs, one encode each: the file log gets the orjson
+        # payload (human-readable lines), Redis gets a separate msgpack
+        # blob (binary, smaller, datetime-native for get_recent_actions).
+        # Mongo takes the dict itself via the batch writer.
+        payload = self._encode(log_entry)
+        try:
+            await asyncio.gather(
+                self._log_to_mongodb(log_entry),
+                self._log_to_redis(self._pack(log_entry)),
+                self._log_to_file(payload)
+            )
+        except Exception as e:
+            cprint(f"❌ Failed to log user action: {e}", "red")
+
+    async def log_error(self, error: str, context: Dict[str, Any], user_id: str = "anonymous"):
+        """Log an error with its context"""
+        await self.log_user_action("error", {"error": error, "context": context}, user_id)
+
+    def log_user_action_nowait(self, action: str, data: Dict[str, Any], user_id: str = "anonymous"):
+        """Enqueue a user action log without awaiting the sinks
+
+        Trade handlers use this so log latency stays off the trade
+        critical path; once _inflight saturates the event is dropped
+        rather than letting background tasks grow unbounded.
+        """
+        if self._inflight >= self._max_inflight:
+            cprint("⚠️ Logging backlog full, dropping entry", "yellow")
+            return
+        self._inflight += 1
+        task = asyncio.create_task(self.log_user_action(action, data, user_id))
+        task.add_done_callback(self._on_log_done)
+
+    def log_error_nowait(self, error: str, context: Dict[str, Any], user_id: str = "anonymous"):
+        """Enqueue an error log without awaiting the sinks"""
+        self.log_user_action_nowait("error", {"error": error, "context": context}, user_id)
+
+    def _on_log_done(self, task: asyncio.Task):
+        self._inflight -= 1
+        if not task.cancelled() and task.exception():
+            cprint(f"❌ Background log failed: {task.exception()}", "red")
+
+    async def _log_to_mongodb(self, log_entry: Dict[str, Any]):
+        self._ensure_writer()
+        try:
+            self._mongo_queue.put_nowait(dict(log_entry))
+        except asyncio.QueueFull:
+            cprint("⚠️ MongoDB log queue full, dropping entry", "yellow")
+
+    async def _log_to_redis(self, payload: bytes):
+        # One socket write/read for the push+trim pair instead of two
+        # sequential round trips
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.lpush("recent_user_actions", payload)
+            pipe.ltrim("recent_user_actions", 0, 999)
+            await pipe.execute()
+
+    async def _log_to_file(self, payload: bytes):
+        self.file_logger.info(payload.decode())
+
+    async def get_recent_actions(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get the most recent user actions from Redis"""
+        actions = await self.redis_client.lrange("recent_user_actions", 0, limit - 1)
+        unpack = self._unpack
+        return [unpack(action) for action in actions]
+
+    async def iter_recent_actions(self, limit: int = 100):
+        """Yield recent user actions newest-first without buffering them all
+
+        Large limits come from the MongoDB cursor in batches so callers
+        can stream documents as they arrive; the Redis hot list only
+        holds the newest 1000 fully-materialized entries.
+        """
+        cursor = self.user_logs.find({}, {"_id": False}).sort("timestamp", -1).limit(limit)
+        async for doc in cursor:
+            yield doc
+
+logging_service = LoggingService()
@@ -0,0 +1,322 @@
+"""
+Order Manager
+Creates, schedules and executes user orders (immediate, timed, conditional)
+"""
+
+import asyncio
+import heapq
+import os
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from termcolor import cprint
+from src.data.chainstack_client import ChainStackClient
+from src.data.jupiter_client import JupiterClient
+from pymongo import ReturnDocument, UpdateOne
+from src.db.mongo import get_client
+from src.services.logging_service import logging_service
+
+SOL_TOKEN = "So11111111111111111111111111111111111111112"
+ONE_SOL_LAMPORTS = "1000000000"
+
+def _to_lamports(amount_sol: float) -> int:
+    return int(amount_sol * 1_000_000_000)
+
+
+class OrderManager:
+    def __init__(self):
+        self.client = get_client()
+        self.db = self.client.lumixd
+        self.orders = self.db.orders
+        self.positions = self.db.positions
+        self.jupiter_client = JupiterClient()
+        self.chainstack_client = ChainStackClient()
+        # Conditional orders are driven by a heap-ordered timer task;
+        # timed orders are picked up by the Mongo-backed dispatcher, so
+        # pending-order count never grows in-process state
+        self._timers: List[tuple] = []
+        self._timer_wakeup = asyncio.Event()
+        self._timer_task: Optional[asyncio.Task] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        self._conditional_interval = 10.0  # seconds
+        self._dispatch_interval = 1.0  # seconds
+        # Conditional orders on the same token share one quote per TTL
+        # window instead of each issuing an identical HTTP call
+        self._price_cache: Dict[str, tuple] = {}  # token -> (price, expires_at)
+        self._price_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._price_ttl = 0.2  # seconds
+        self._tracked_tokens: set = set()
+        # Tracked tokens change at order-creation cadence, not per read
+        self._tracked_cache: tuple = (0.0, [])  # (expires_at, tokens)
+        self._tracked_ttl = 2.0  # seconds
+        # Environment is fixed for the process lifetime; bind it once
+        # instead of re-reading os.environ on every order
+        self._wallet = os.getenv("WALLET_ADDRESS", "")
+        self._max_trade_lamports = _to_lamports(float(os.getenv("MAX_TRADE_SIZE_SOL", "10.0")))
+
+    async def start(self):
+        """Create indexes, recover missed orders and start the loops"""
+        # Indexes must exist before recovery queries the collections, and
+        # awaiting here surfaces creation errors instead of swallowing
+        # them in a fire-and-forget task
+        await self._create_indexes()
+        await self.recover_pending_orders()
+        if self._timer_task is None or self._timer_task.done():
+            self._timer_task = asyncio.create_task(self._timer_loop())
+        if self._dispatcher_task is None or self._dispatcher_task.done():
+            self._dispatcher_task = asyncio.create_task(self._dispatcher())
+
+    async def _dispatcher(self):
+        """Execute timed orders as they come due
+
+        One indexed query per second replaces a timer entry per pending
+        order, so memory stays constant no matter how many orders wait.
+        """
+        while True:
+            try:
+                now = datetime.now(timezone.utc)
+                due = await self.orders.find(
+                    {"status": "pending", "execute_at": {"$lte": now}}
+                ).to_list(1000)
+                if due:
+                    await asyncio.gather(*[self.execute_order(o["id"]) for o in due])
+            except Exception as e:
+                cprint(f"❌ Order dispatcher error: {e}", "red")
+            await asyncio.sleep(self._dispatch_interval)
+
+    def _schedule(self, due_ts: float, order_id: str, kind: str):
+        heapq.heappush(self._timers, (due_ts, order_id, kind))
+        # Wake the loop in case this deadline is sooner than the one it
+        # is currently sleeping towards
+        self._timer_wakeup.set()
+
+    async def _timer_loop(self):
+        """Sleep until the nearest deadline and dispatch due orders"""
+        while True:
+            if not self._timers:
+                await self._timer_wakeup.wait()
+                self._timer_wakeup.clear()
+                continue
+            delay = self._timers[0][0] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._timer_wakeup.wait(), timeout=delay)
+                    self._timer_wakeup.clear()
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+            _, order_id, _ = heapq.heappop(self._timers)
+            asyncio.create_task(self._run_conditional_check(order_id))
+
+    async def _run_conditional_check(self, order_id: str):
+        try:
+            still_pending = await self.check_conditional_order(order_id)
+        except Exception as e:
+            cprint(f"❌ Conditional check failed for {order_id}: {e}", "red")
+            still_pending = True
+        if still_pending:
+            self._schedule(time.time() + self._conditional_interval, order_id, "conditional")
+
+    async def _create_indexes(self):
+        await self.orders.create_index([("id", 1)], unique=True)
+        await self.orders.create_index([("user_id", 1)])
+        # Covers the status-filtered distinct in get_tracked_tokens
+        await self.orders.create_index([("status", 1), ("token", 1)])
+        # Covers the dispatcher's due-order scan
+        await self.orders.create_index([("status", 1), ("execute_at", 1)])
+
+    def _build_order(self, user_id: str, token: str, direction: str, amount_sol: float) -> Dict[str, Any]:
+        return {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "token": token,
+            "direction": direction,
+            "amount_sol": amount_sol,
+            "status": "pending",
+            "signature": None,
+            "created_at": datetime.now(timezone.utc)
+        }
+
+    async def create_immediate_order(self, user_id: str, token: str, direction: str, amount_sol: float) -> Optional[str]:
+        """Create and immediately execute an order"""
+        order = self._build_order(user_id, token, direction, amount_sol)
+        await self.orders.insert_one(order)
+        self._tracked_tokens.add(token)
+        success = await self.execute_order(order["id"])
+        return order["id"] if success else None
+
+    async def create_timed_order(self, user_id: str, token: str, direction: str,
+                                 amount_sol: float, execute_at: datetime) -> str:
+        """Create an order scheduled for a future time"""
+        order = self._build_order(user_id, token, direction, amount_sol)
+        order["execute_at"] = execute_at
+        await self.orders.insert_one(order)
+        self._tracked_tokens.add(token)
+        return order["id"]
+
+    async def create_conditional_order(self, user_id: str, token: str, direction: str,
+                                       amount_sol: float, condition: Dict[str, Any]) -> str:
+        """Create an order that executes when a price condition is met"""
+        order = self._build_order(user_id, token, direction, amount_sol)
+        order["condition"] = condition
+        await self.orders.insert_one(order)
+        self._tracked_tokens.add(token)
+        self._schedule(time.time(), order["id"], "conditional")
+        return order["id"]
+
+    async def execute_order(self, order_id: str) -> bool:
+        """Execute a pending order via Jupiter"""
+        # Atomically claim the order: one round trip instead of a read
+        # plus a later write, and a concurrent executor can't pick up the
+        # same order in between
+        order = await self.orders.find_one_and_update(
+            {"id": order_id, "status": "pending"},
+            {"$set": {"status": "executing", "started_at": datetime.now(timezone.utc)}},
+            return_document=ReturnDocument.AFTER
+        )
+        if not order:
+            return False
+        try:
+            amount_lamports_int = _to_lamports(order["amount_sol"])
+            if amount_lamports_int > self._max_trade_lamports:
+                await self.update_order_status(order_id, "rejected", reason="exceeds_max_trade_size")
+                return False
+            amount_lamports = str(amount_lamports_int)
+            if order["direction"] == "buy":
+                input_token, output_token = SOL_TOKEN, order["token"]
+            else:
+                input_token, output_token = order["token"], SOL_TOKEN
+            # JupiterClient is requests-based; run it in a worker thread so
+            # concurrent order executions don't serialize on HTTP I/O
+            quote = await asyncio.to_thread(
+                self.jupiter_client.get_quote, input_token, output_token, amount_lamports
+            )
+            if not quote:
+                await self.update_order_status(order_id, "failed", reason="no_quote")
+                return False
+            signature = await asyncio.to_thread(self.jupiter_client.execute_swap, quote, self._wallet)
+            if not signature:
+                await self.update_order_status(order_id, "failed", reason="swap_failed")
+                return False
+            await self.update_order_status(order_id, "executed", signature=signature)
+            logging_service.log_user_action_nowait(
+                "order_executed", {"order_id": order_id, "signature": signature}, order["user_id"]
+            )
+            return True
+        except Exception as e:
+            await self.update_order_status(order_id, "failed", reason=str(e))
+            logging_service.log_error_nowait(str(e), {"order_id": order_id}, order.get("user_id", "anonymous"))
+            return False
+
+    async def update_order_status(self, order_id: str, status: str,
+                                  signature: Optional[str] = None, reason: Optional[str] = None):
+        update = {"status": status, "updated_at": datetime.now(timezone.utc)}
+        if signature is not None:
+            update["signature"] = signature
+        if reason is not None:
+            update["reason"] = reason
+        await self.orders.update_one({"id": order_id}, {"$set": update})
+
+    async def check_conditional_order(self, order_id: str) -> bool:
+        """Check a conditional order's price trigger and execute when met
+
+        Returns True while the order should stay armed.
+        """
+        order = await self.orders.find_one({"id": order_id})
+        if not order or order["status"] != "pending":
+            return False
+        condition = order.get("condition", {})
+        current_price = await self._get_token_price(order["token"])
+        if current_price is None:
+            return True
+        target_price = float(condition.get("price", 0))
+        triggered = (
+            (condition.get("operator") == "above" and current_price >= target_price)
+            or (condition.get("operator") == "below" and current_price <= target_price)
+        )
+        if triggered:
+            await self.execute_order(order_id)
+            return False
+        return True
+
+    async def _get_token_price(self, token: str) -> Optional[float]:
+        """Get the token's SOL price, coalescing concurrent lookups"""
+        cached = self._price_cache.get(token)
+        now = time.monotonic()
+        if cached and cached[1] > now:
+            return cached[0]
+        async with self._price_locks[token]:
+            cached = self._price_cache.get(token)
+            now = time.monotonic()
+            if cached and cached[1] > now:
+                return cached[0]
+            quote = await asyncio.to_thread(self.jupiter_client.get_quote, token, SOL_TOKEN, ONE_SOL_LAMPORTS)
+            if not quote:
+                return None
+            price = float(quote.get("outAmount", 0)) / 1e9
+            self._price_cache[token] = (price, now + self._price_ttl)
+            return price
+
+    async def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        return await self.orders.find_one({"id": order_id}, {"_id": 0})
+
+    async def get_user_orders(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        return await self.orders.find({"user_id": user_id}, {"_id": 0}).sort("created_at", -1).to_list(limit)
+
+    async def get_tracked_tokens(self) -> List[str]:
+        """Get tokens with live orders plus in-process tracking"""
+        expires_at, cached = self._tracked_cache
+        if time.monotonic() < expires_at:
+            return cached
+        tokens = await self.orders.distinct('token', {'status': {'$in': ['pending', 'executed']}})
+        result = list(self._tracked_tokens.union(tokens))
+        self._tracked_cache = (time.monotonic() + self._tracked_ttl, result)
+        return result
+
+    async def _sync_positions(self):
+        """Rebuild the positions collection from on-chain balances"""
+        tokens = await self.get_tracked_tokens()
+        await self.positions.delete_many({})
+        # One RPC round-trip worth of wall time for all tokens instead of
+        # one serial round-trip per token
+        balances = await asyncio.gather(
+            *[self.chainstack_client.get_token_balance(token, self._wallet) for token in tokens],
+            return_exceptions=True
+        )
+        now = datetime.now(timezone.utc)
+        docs = [
+            {"token": token, "balance": balance, "synced_at": now}
+            for token, balance in zip(tokens, balances)
+            if not isinstance(balance, Exception) and balance > 0
+        ]
+        if docs:
+            await self.positions.insert_many(docs, ordered=False)
+
+    async def recover_pending_orders(self):
+        """Re-arm pending orders after a restart"""
+        now = datetime.now(timezone.utc)
+        pending = await self.orders.find({"status": "pending"}).to_list(None)
+        missed_ops = []
+        for order in pending:
+            execute_at = order.get("execute_at")
+            if execute_at is not None:
+                if execute_at.tzinfo is None:
+                    execute_at = execute_at.replace(tzinfo=timezone.utc)
+                if execute_at <= now:
+                    missed_ops.append(UpdateOne(
+                        {"id": order["id"]},
+                        {"$set": {"status": "cancelled",
+                                  "reason": "system_restart_missed_execution",
+                                  "updated_at": now}}
+                    ))
+                # Future timed orders need no re-arming: the dispatcher
+                # finds them by execute_at
+            elif order.get("condition"):
+                self._schedule(time.time(), order["id"], "conditional")
+            self._tracked_tokens.add(order["token"])
+        if missed_ops:
+            # One round trip for the whole missed batch after a restart
+            await self.orders.bulk_write(missed_ops, ordered=False)
+        await self._sync_positions()
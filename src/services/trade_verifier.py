@@ -0,0 +1,194 @@
+"""
+Trade Verifier
+Confirms executed trades against Solscan
+"""
+
+import asyncio
+import re
+from typing import Any, Dict, List, Optional
+import aiohttp
+import orjson
+from cachetools import TTLCache
+from termcolor import cprint
+from src.services.logging_service import logging_service
+
+SOLSCAN_URL = "https://public-api.solscan.io"
+# Solana signatures are 64 bytes base58-encoded (~87-88 chars); anything
+# else is rejected before it can touch the cache or the network
+_SIG_RE = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{86,90}\Z').match
+
+class TradeVerifier:
+    def __init__(self):
+        self.headers = {"accept": "application/json"}
+        # Repeat lookups (retries, webhooks, user refreshes) hit these
+        # instead of Solscan; only terminal chain results are cached so a
+        # transient network error never sticks
+        self._verify_cache: TTLCache = TTLCache(maxsize=8192, ttl=300)
+        self._details_cache: TTLCache = TTLCache(maxsize=2048, ttl=60)
+        # One pooled session for every verification; building a session
+        # per call pays a fresh TCP+TLS handshake to Solscan each time
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Concurrent single-signature calls are coalesced into small
+        # batches so bursts ride the pool together instead of queueing
+        self._verify_queue: asyncio.Queue = asyncio.Queue()
+        self._coalescer_task: Optional[asyncio.Task] = None
+        self._batch_size = 32
+        self._batch_window = 0.005  # seconds
+        # Application-level cap matching the connector's per-host limit,
+        # so bursts queue smoothly instead of churning the TCP pool
+        self._sem = asyncio.Semaphore(8)
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=8,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            if self._keepalive_task is None or self._keepalive_task.done():
+                self._keepalive_task = asyncio.create_task(self._keepalive_ping())
+        return self._session
+
+    async def _keepalive_ping(self):
+        """Cheap periodic request so idle connections don't get evicted
+        and force a fresh TLS handshake on the next real verification"""
+        while True:
+            await asyncio.sleep(60)
+            if self._session is None or self._session.closed:
+                return
+            try:
+                async with self._session.head(SOLSCAN_URL):
+                    pass
+            except Exception:
+                pass
+
+    async def close(self):
+        """Close the pooled session (call on application shutdown)"""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def verify_transaction(self, signature: str) -> Dict[str, Any]:
+        """Check whether a transaction succeeded on-chain"""
+        if not signature or not _SIG_RE(signature):
+            return {"verified": False, "error": "invalid_signature"}
+        cached = self._verify_cache.get(signature)
+        if cached is not None:
+            return cached
+        self._ensure_coalescer()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._verify_queue.put_nowait((signature, future))
+        return await future
+
+    async def verify_transactions(self, signatures: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Verify a batch of signatures concurrently"""
+        results: Dict[str, Dict[str, Any]] = {}
+        misses = []
+        for signature in signatures:
+            if not signature or not _SIG_RE(signature):
+                results[signature] = {"verified": False, "error": "invalid_signature"}
+                continue
+            cached = self._verify_cache.get(signature)
+            if cached is not None:
+                results[signature] = cached
+            else:
+                misses.append(signature)
+        if misses:
+            session = await self._get_session()
+            fetched = await asyncio.gather(
+                *[self._verify_one(session, s) for s in misses], return_exceptions=True
+            )
+            for signature, result in zip(misses, fetched):
+                if isinstance(result, Exception):
+                    result = {"verified": False, "error": str(result)}
+                results[signature] = result
+        return results
+
+    def _ensure_coalescer(self):
+        if self._coalescer_task is None or self._coalescer_task.done():
+            self._coalescer_task = asyncio.create_task(self._coalescer())
+
+    async def _coalescer(self):
+        """Group verifications arriving within a few ms into one batch"""
+        while True:
+            batch = [await self._verify_queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._verify_queue.get(), timeout=self._batch_window
+                    ))
+                except asyncio.TimeoutError:
+                    break
+            session = await self._get_session()
+            results = await asyncio.gather(
+                *[self._verify_one(session, sig) for sig, _ in batch], return_exceptions=True
+            )
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    result = {"verified": False, "error": str(result)}
+                if not future.done():
+                    future.set_result(result)
+
+    async def _verify_one(self, session: aiohttp.ClientSession, signature: str) -> Dict[str, Any]:
+        cached = self._verify_cache.get(signature)
+        if cached is not None:
+            return cached
+        try:
+            async with self._sem:
+                async with session.get(f"{SOLSCAN_URL}/transaction/{signature}") as response:
+                    # Happy path runs straight through; error statuses
+                    # surface as exceptions below. content_type=None
+                    # skips aiohttp's MIME sniff before the parse
+                    response.raise_for_status()
+                    data = await response.json(loads=orjson.loads, content_type=None)
+                # A follow-up get_transaction_details for this signature
+                # becomes a dict lookup instead of a second fetch+parse
+                self._details_cache[signature] = data
+                status = data.get("status", "")
+                if status == "Success":
+                    result = {"verified": True, "error": None}
+                    self._verify_cache[signature] = result
+                    return result
+                result = {"verified": False, "error": status or "unknown_status"}
+                if status == "Fail":
+                    # Failed on-chain is just as final as success
+                    self._verify_cache[signature] = result
+                return result
+        except aiohttp.ClientResponseError as e:
+            return {"verified": False, "error": f"solscan_status_{e.status}"}
+        except Exception as e:
+            cprint(f"❌ Failed to verify transaction {signature}: {e}", "red")
+            logging_service.log_error_nowait(str(e), {"signature": signature})
+            return {"verified": False, "error": str(e)}
+
+    async def get_transaction_details(self, signature: str) -> Optional[Dict[str, Any]]:
+        """Get the full Solscan record for a transaction"""
+        if not signature or not _SIG_RE(signature):
+            return None
+        cached = self._details_cache.get(signature)
+        if cached is not None:
+            return cached
+        try:
+            session = await self._get_session()
+            async with self._sem:
+                async with session.get(f"{SOLSCAN_URL}/transaction/{signature}") as response:
+                    response.raise_for_status()
+                    details = await response.json(loads=orjson.loads, content_type=None)
+            self._details_cache[signature] = details
+            return details
+        except aiohttp.ClientResponseError:
+            return None
+        except Exception as e:
+            cprint(f"❌ Failed to get transaction details for {signature}: {e}", "red")
+            logging_service.log_error_nowait(str(e), {"signature": signature})
+            return None
+
+trade_verifier = TradeVerifier()
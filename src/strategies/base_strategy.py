@@ -3,30 +3,96 @@ Lumix Base Strategy Class
 All custom strategies should inherit from this
 """
 
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+from src.utils.logging_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+@dataclass(slots=True)
+class Signal:
+    """One strategy verdict; slotted so a high-frequency evaluation
+    loop isn't allocating a dict (plus metadata sub-dict) per tick"""
+    token: Optional[str]
+    signal: float
+    direction: str
+    metadata: dict = field(default_factory=dict)
+
+# Shared neutral result for error/no-signal fast paths; copy with
+# dataclasses.replace rather than mutating
+NEUTRAL = Signal(None, 0.0, 'NEUTRAL', {})
+
 class BaseStrategy:
+    # One RPC response per token per tick, shared by every strategy that
+    # asks within the TTL window
+    _market_cache: dict = {}  # token -> (fetched_at, data)
+    _frame_cache: dict = {}  # token -> (fetched_at, MarketFrame)
+    _MARKET_TTL = 1.0  # seconds
+
     def __init__(self, name: str):
         self.name = name
         self.token = None
-        
+        self.max_position_size = 0.20
+
     def get_market_data(self) -> dict:
         """Get market data for analysis"""
-        from src.data.chainstack_client import ChainStackClient
-        client = ChainStackClient()
-        return client.get_token_data(self.token)
-        
+        now = time.monotonic()
+        hit = BaseStrategy._market_cache.get(self.token)
+        if hit is not None and now - hit[0] < BaseStrategy._MARKET_TTL:
+            return hit[1]
+        from src.data.chainstack_client import get_client
+        data = get_client().get_token_data(self.token)
+        BaseStrategy._market_cache[self.token] = (now, data)
+        return data
+
+    def get_market_frame(self):
+        """Get market data as a MarketFrame of contiguous arrays"""
+        now = time.monotonic()
+        hit = BaseStrategy._frame_cache.get(self.token)
+        if hit is not None and now - hit[0] < BaseStrategy._MARKET_TTL:
+            return hit[1]
+        from src.data.chainstack_client import get_client
+        frame = get_client().get_token_frame(self.token)
+        BaseStrategy._frame_cache[self.token] = (now, frame)
+        return frame
+
+    @classmethod
+    def invalidate(cls, token: str):
+        """Drop the cached market data for a token (e.g. after a trade)"""
+        cls._market_cache.pop(token, None)
+        cls._frame_cache.pop(token, None)
+
     def set_token(self, token: str):
         """Set token for analysis"""
         self.token = token
 
-    def generate_signals(self) -> dict:
+    def validate_trade(self, amount_sol: float, balance_sol: float) -> bool:
+        """Check a candidate trade against position limits
+
+        Rejections log lazily (%-style args) so a busy loop that turns
+        down many candidates pays nothing for formatting when the level
+        is raised via LOG_LEVEL.
+        """
+        if amount_sol <= 0:
+            return False
+        if balance_sol <= 0:
+            logger.warning("No balance available to trade %s", self.token)
+            return False
+        max_size = balance_sol * self.max_position_size
+        if amount_sol > max_size:
+            logger.warning("Position size %.4f SOL exceeds max %.1f%% of balance %.4f",
+                           amount_sol, self.max_position_size * 100, balance_sol)
+            return False
+        return True
+
+    def generate_signals(self) -> Signal:
         """
         Generate trading signals
         Returns:
-            dict: {
-                'token': str,          # Token address
-                'signal': float,       # Signal strength (0-1)
-                'direction': str,      # 'BUY', 'SELL', or 'NEUTRAL'
-                'metadata': dict       # Optional strategy-specific data
-            }
+            Signal: token, signal strength (0-1), direction
+            ('BUY'/'SELL'/'NEUTRAL') and strategy-specific metadata.
+            Use dataclasses.asdict at the JSON boundary if a dict
+            is needed.
         """
-        raise NotImplementedError("Strategy must implement generate_signals()")   
\ No newline at end of file
+        raise NotImplementedError("Strategy must implement generate_signals()")
@@ -1,12 +1,12 @@
 """
 Example Strategy
 Simple Moving Average Crossover Strategy Example
-A basic strategy implementation using TA-Lib indicators
+A basic strategy implementation using incremental rolling means
 """
 
-from .base_strategy import BaseStrategy
-import talib
-import numpy as np
+import dataclasses
+from collections import deque
+from .base_strategy import BaseStrategy, NEUTRAL, Signal
 
 class ExampleStrategy(BaseStrategy):
     def __init__(self):
@@ -14,37 +14,65 @@ class ExampleStrategy(BaseStrategy):
         self.description = "Simple Moving Average Crossover Strategy"
         self.fast_period = 20
         self.slow_period = 50
-        
-    def generate_signals(self) -> dict:
+        # Rolling windows updated in O(1) per new bar; recomputing the
+        # SMAs over the full history each tick was O(N) for two values
+        self._fast_window = deque(maxlen=self.fast_period)
+        self._slow_window = deque(maxlen=self.slow_period)
+        self._fast_sum = 0.0
+        self._slow_sum = 0.0
+        self._last_bar_ts = None
+        self._prev_fast = None
+        self._prev_slow = None
+
+    def _update(self, price: float):
+        """Push one bar through both rolling windows"""
+        if len(self._fast_window) == self.fast_period:
+            self._fast_sum -= self._fast_window[0]
+        self._fast_window.append(price)
+        self._fast_sum += price
+        if len(self._slow_window) == self.slow_period:
+            self._slow_sum -= self._slow_window[0]
+        self._slow_window.append(price)
+        self._slow_sum += price
+
+    def generate_signals(self) -> Signal:
         try:
             data = self.get_market_data()
-            close = data['close'].values
-            
-            # Calculate SMAs
-            sma_fast = talib.SMA(close, timeperiod=self.fast_period)
-            sma_slow = talib.SMA(close, timeperiod=self.slow_period)
-            
-            # Generate signal
+            if data.empty:
+                return dataclasses.replace(NEUTRAL, token=self.token)
+            # The client returns a fixed-size snapshot on every call, not
+            # an append-only history, so new bars are detected by their
+            # timestamp — comparing array lengths would freeze the
+            # windows after the first tick
+            bar_ts = data['Datetime (UTC)'].iloc[-1]
+            if bar_ts != self._last_bar_ts:
+                if len(self._slow_window) == self.slow_period:
+                    self._prev_fast = self._fast_sum / len(self._fast_window)
+                    self._prev_slow = self._slow_sum / len(self._slow_window)
+                self._update(float(data['Close'].iloc[-1]))
+                self._last_bar_ts = bar_ts
+
             signal = 0
-            if sma_fast[-1] > sma_slow[-1] and sma_fast[-2] <= sma_slow[-2]:
-                signal = 1  # Buy signal
-            elif sma_fast[-1] < sma_slow[-1] and sma_fast[-2] >= sma_slow[-2]:
-                signal = -1  # Sell signal
-                
-            return {
-                'token': self.token,
-                'signal': abs(signal),
-                'direction': 'BUY' if signal > 0 else 'SELL' if signal < 0 else 'NEUTRAL',
-                'metadata': {
-                    'sma_fast': float(sma_fast[-1]),
-                    'sma_slow': float(sma_slow[-1])
+            if len(self._slow_window) == self.slow_period and self._prev_fast is not None:
+                sma_fast = self._fast_sum / len(self._fast_window)
+                sma_slow = self._slow_sum / len(self._slow_window)
+                if sma_fast > sma_slow and self._prev_fast <= self._prev_slow:
+                    signal = 1  # Buy signal
+                elif sma_fast < sma_slow and self._prev_fast >= self._prev_slow:
+                    signal = -1  # Sell signal
+            else:
+                sma_fast = self._fast_sum / max(len(self._fast_window), 1)
+                sma_slow = self._slow_sum / max(len(self._slow_window), 1)
+
+            return Signal(
+                self.token,
+                abs(signal),
+                'BUY' if signal > 0 else 'SELL' if signal < 0 else 'NEUTRAL',
+                {
+                    'sma_fast': float(sma_fast),
+                    'sma_slow': float(sma_slow)
                 }
-            }
+            )
         except Exception as e:
             print(f"Error generating signals: {e}")
-            return {
-                'token': self.token,
-                'signal': 0.0,
-                'direction': 'NEUTRAL',
-                'metadata': {'error': str(e)}
-            }
+            return dataclasses.replace(NEUTRAL, token=self.token, metadata={'error': str(e)})
@@ -0,0 +1,4 @@
+"""
+Lumix Trading
+Order generation and execution strategies
+"""
@@ -0,0 +1,51 @@
+"""
+Trading Strategy V2
+Turns parsed trade instructions into executable orders
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+from termcolor import cprint
+from src.data.jupiter_client_v2 import JupiterClientV2
+
+class TradingStrategy:
+    def __init__(self, jupiter_client: Optional[JupiterClientV2] = None):
+        self.jupiter_client = jupiter_client or JupiterClientV2()
+        self.wallet_address = os.getenv("WALLET_ADDRESS", "")
+        self.default_amount_lamports = "1000000000"
+
+    async def generate_orders(self, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build order dicts from parsed instruction parameters"""
+        token = parameters.get("token")
+        if not token:
+            return []
+        amount = str(parameters.get("amount_lamports", self.default_amount_lamports))
+        direction = parameters.get("direction", "buy")
+        if direction == "buy":
+            input_mint, output_mint = self.jupiter_client.sol_token, token
+        else:
+            input_mint, output_mint = token, self.jupiter_client.sol_token
+        return [{
+            "input_mint": input_mint,
+            "output_mint": output_mint,
+            "amount": amount,
+            "direction": direction
+        }]
+
+    async def execute_strategy(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Quote and execute each order via Jupiter"""
+        results = []
+        for order in orders:
+            quote = await self.jupiter_client.get_quote(
+                order["input_mint"], order["output_mint"], order["amount"]
+            )
+            if not quote:
+                results.append({"order": order, "status": "failed", "reason": "no_quote"})
+                continue
+            signature = await self.jupiter_client.execute_swap(quote, self.wallet_address)
+            if signature:
+                results.append({"order": order, "status": "executed", "signature": signature})
+            else:
+                cprint(f"❌ Swap failed for {order['output_mint']}", "red")
+                results.append({"order": order, "status": "failed", "reason": "swap_failed"})
+        return results
@@ -0,0 +1,8 @@
+"""
+Lumix Utils
+Shared helpers
+"""
+
+from src.utils.logging_utils import setup_logger
+
+__all__ = ["setup_logger"]
@@ -0,0 +1,30 @@
+"""
+Lumix Env Utils
+Cached .env loading and required-variable checks
+"""
+
+import functools
+import os
+from pathlib import Path
+from typing import List, Optional
+from dotenv import load_dotenv
+
+@functools.lru_cache(maxsize=1)
+def load_environment() -> bool:
+    """Load .env once per process
+
+    Callers throughout the tree can invoke this freely; only the first
+    call touches the filesystem, the rest hit the lru_cache.
+    """
+    env_path = Path(".env")
+    if not env_path.exists():
+        return False
+    load_dotenv(env_path)
+    return True
+
+def verify_environment(required_vars: List[str]) -> Optional[str]:
+    """Return an error message naming any missing variables, else None"""
+    missing = [var for var in required_vars if not os.environ.get(var)]
+    if missing:
+        return f"Missing required environment variables: {','.join(missing)}"
+    return None
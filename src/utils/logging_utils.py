@@ -0,0 +1,53 @@
+"""
+Lumix Logging Utils
+Levelled module loggers with env-controlled verbosity
+"""
+
+import atexit
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_DIR = "logs"
+# Dated path computed once per process; reloads and repeated
+# setup_logger calls reuse it instead of re-running strftime
+_LOG_FILE = os.path.join(LOG_DIR, f"lumix_{time.strftime('%Y%m%d')}.log")
+
+_log_queue = None
+_listener = None
+
+def _get_queue() -> queue.Queue:
+    """Shared log queue; the listener thread owns the file and stream
+    handlers so logger calls are just an enqueue, never disk I/O"""
+    global _log_queue, _listener
+    if _log_queue is None:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        formatter = logging.Formatter('%(asctime)s %(name)s %(levelname)s %(message)s')
+        file_handler = logging.FileHandler(_LOG_FILE)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        _log_queue = queue.Queue(-1)
+        _listener = QueueListener(_log_queue, file_handler, stream_handler,
+                                  respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+    return _log_queue
+
+def setup_logger(name: str, null: bool = False) -> logging.Logger:
+    """Get a configured logger
+
+    Level comes from LOG_LEVEL (default INFO), so hot-path log calls
+    below the level cost only an integer comparison — no formatting,
+    no I/O. Pass null=True for library-style silence by default.
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        if null:
+            logger.addHandler(logging.NullHandler())
+        else:
+            logger.addHandler(QueueHandler(_get_queue()))
+        logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    return logger
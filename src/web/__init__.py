@@ -0,0 +1,4 @@
+"""
+Lumix Web
+HTTP and websocket front-ends for the trading system
+"""
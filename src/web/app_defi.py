@@ -0,0 +1,131 @@
+"""
+Lumix DeFi Web App
+FastAPI app streaming token prices over a websocket
+"""
+
+import asyncio
+import functools
+import os
+import msgpack
+import orjson
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import redis.asyncio as aioredis
+from termcolor import cprint
+from src.data.chainstack_client import get_client as get_chainstack_client
+from src.services.logging_service import logging_service
+from src.services.trade_verifier import trade_verifier
+
+ERROR_MESSAGES = {
+    "invalid_token": {"zh": "无效的代币地址", "en": "Invalid token address"},
+    "price_unavailable": {"zh": "暂时无法获取价格", "en": "Price temporarily unavailable"},
+    "rate_limited": {"zh": "请求过于频繁", "en": "Too many requests"},
+    "internal_error": {"zh": "内部错误", "en": "Internal error"}
+}
+# Concatenated once at import; the per-error f-string rebuilt the same
+# zh|en text on every hot error path
+FORMATTED_ERRORS = {key: f"{msg['zh']} | {msg['en']}" for key, msg in ERROR_MESSAGES.items()}
+
+app = FastAPI(title="Lumix DeFi")
+# decode_responses stays off so orjson bytes round-trip untouched
+redis_client = aioredis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"),
+                                 decode_responses=False)
+# Price-cache writes are coalesced here and flushed as one Redis
+# pipeline per batch window instead of one setex round trip each
+_price_writes: asyncio.Queue = asyncio.Queue()
+_price_writer_task = None
+# C-accelerated binary codec for websocket frames; Redis cache entries
+# stay orjson so other readers of price:* keys are unaffected
+_pack = functools.partial(msgpack.packb, use_bin_type=True)
+
+def _ensure_price_writer():
+    global _price_writer_task
+    if _price_writer_task is None or _price_writer_task.done():
+        _price_writer_task = asyncio.create_task(_price_writer())
+
+async def _price_writer():
+    while True:
+        batch = [await _price_writes.get()]
+        while len(batch) < 16:
+            try:
+                batch.append(await asyncio.wait_for(_price_writes.get(), timeout=0.005))
+            except asyncio.TimeoutError:
+                break
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, payload in batch:
+                    pipe.setex(key, 300, payload)
+                await pipe.execute()
+        except Exception as e:
+            # Drop the batch and keep draining: a transient Redis outage
+            # must not kill the writer while connected clients keep
+            # enqueueing into the queue with nothing left to empty it
+            cprint(f"❌ Failed to write price batch to Redis: {e}", "red")
+
+@app.websocket("/ws")
+async def price_updates(websocket: WebSocket):
+    """Stream requested token prices, caching each in Redis
+
+    Clients subscribe to many tokens and send them as a burst, so
+    frames arriving within a few ms are drained together, deduplicated
+    per token, fetched concurrently and answered as one batch frame.
+    """
+    await websocket.accept()
+    _ensure_price_writer()
+    # msgpack halves the wire size of streamed batches vs JSON and packs
+    # faster; ?format=json keeps payloads readable for manual debugging
+    use_json = websocket.query_params.get("format") == "json"
+    encode = orjson.dumps if use_json else _pack
+    try:
+        while True:
+            tokens = set()
+            first = await websocket.receive_text()
+            if not first or len(first) < 32:
+                await websocket.send_bytes(encode({"error": FORMATTED_ERRORS["invalid_token"]}))
+                continue
+            tokens.add(first)
+            try:
+                while len(tokens) < 32:
+                    frame = await asyncio.wait_for(websocket.receive_text(), timeout=0.005)
+                    if frame and len(frame) >= 32:
+                        tokens.add(frame)
+            except asyncio.TimeoutError:
+                pass
+            ordered = list(tokens)
+            chainstack = get_chainstack_client()
+            prices = await asyncio.gather(
+                *[asyncio.to_thread(chainstack.get_token_price, t) for t in ordered],
+                return_exceptions=True
+            )
+            data = {}
+            for token, price in zip(ordered, prices):
+                if isinstance(price, Exception):
+                    # Don't hold the websocket loop for logger I/O
+                    logging_service.log_error_nowait(str(price), {"token": token})
+                    continue
+                data[token] = price
+                _price_writes.put_nowait(
+                    (f"price:{token}", orjson.dumps({"token": token, "price": price}))
+                )
+            await websocket.send_bytes(
+                encode({"type": "price_update_batch", "data": data})
+            )
+    except WebSocketDisconnect:
+        pass
+
+@app.on_event("shutdown")
+async def shutdown():
+    await trade_verifier.close()
+    await logging_service.flush()
+
+if __name__ == "__main__":
+    import uvicorn
+    # permessage-deflate is disabled: the price stream sends msgpack
+    # binary frames that barely compress, and zlib at uvicorn's default
+    # level 6 costs more CPU per frame than the bytes it saves. uvicorn
+    # only exposes the on/off switch, not zlib level/memLevel, so off is
+    # the tuned setting here; slow-link clients can front with a proxy
+    # that compresses.
+    uvicorn.run("src.web.app_defi:app", host="0.0.0.0",
+                port=int(os.getenv("DEFI_PORT", "8000")),
+                loop="uvloop", http="httptools",
+                ws="websockets", ws_per_message_deflate=False)
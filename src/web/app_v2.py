@@ -0,0 +1,176 @@
+"""
+Lumix Web App V2
+Trade execution API over the dialogue agent and Jupiter V6
+"""
+
+import asyncio
+import os
+import socket
+import orjson
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, Header, WebSocket, WebSocketDisconnect
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from src.data.jupiter_client_v2 import JupiterClientV2
+from src.trading.trading_strategy_v2 import TradingStrategy
+from src.services.logging_service import logging_service
+from src.web.errors import err_response
+from src.web.defi_routes import agent as defi_agent, router as defi_router
+
+# orjson serializes the nested Jupiter quote results and recent-action
+# lists several times faster than the stdlib encoder behind JSONResponse
+app = FastAPI(title="Lumix Trading V2", default_response_class=ORJSONResponse)
+# Behind the deploy/nginx.conf edge proxy, preflight is answered by
+# nginx and this middleware is dead per-request weight — set
+# LUMIX_EDGE_CORS=1 there to drop it. Without the proxy (local dev) it
+# stays on, with preflight cached for an hour.
+if not os.getenv("LUMIX_EDGE_CORS"):
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_methods=["GET", "POST", "OPTIONS"],
+        allow_headers=["Content-Type", "X-User-ID"],
+        max_age=3600
+    )
+app.include_router(defi_router)
+
+@app.middleware("http")
+async def _response_headers(request, call_next):
+    """Set API cache/sniffing policy once instead of per return site"""
+    response = await call_next(request)
+    if response.headers.get("content-type", "").startswith("application/json"):
+        response.headers.setdefault("Cache-Control", "no-store")
+    response.headers.setdefault("X-Content-Type-Options", "nosniff")
+    return response
+
+# Shared across requests so the underlying connection pool to
+# quote-api.jup.ag survives between trades; constructing these per
+# request paid a TLS handshake on every POST
+_jupiter_client: Optional[JupiterClientV2] = None
+_trading_strategy: Optional[TradingStrategy] = None
+_init_lock = asyncio.Lock()
+
+async def _get_jupiter_client() -> JupiterClientV2:
+    global _jupiter_client
+    if _jupiter_client is None:
+        async with _init_lock:
+            if _jupiter_client is None:
+                _jupiter_client = JupiterClientV2()
+    return _jupiter_client
+
+async def _get_trading_strategy() -> TradingStrategy:
+    global _trading_strategy
+    if _trading_strategy is None:
+        async with _init_lock:
+            if _trading_strategy is None:
+                _trading_strategy = TradingStrategy(await _get_jupiter_client())
+    return _trading_strategy
+
+# Read once at import; the page has no dynamic context, so rendering or
+# even re-reading it per view would be pure overhead
+with open(os.path.join(os.path.dirname(__file__), "static", "index.html"), "rb") as f:
+    _INDEX_HTML = f.read()
+
+@app.get("/")
+async def index():
+    """Static landing page | 静态首页"""
+    return Response(_INDEX_HTML, media_type="text/html",
+                    headers={"Cache-Control": "public, max-age=3600"})
+
+@app.websocket("/ws")
+async def health_ws(websocket: WebSocket):
+    """Lightweight ping/pong channel for monitors and load tests"""
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            await websocket.send_text("pong" if message == "ping" else message)
+    except WebSocketDisconnect:
+        pass
+
+class TradeRequest(BaseModel):
+    parameters: Dict[str, Any]
+
+@app.post("/api/execute_trade")
+async def execute_trade(body: TradeRequest, user_id: str = Header("anonymous", alias="X-User-ID")):
+    """Execute a trade instruction | 执行交易指令"""
+    if not body.parameters.get("token"):
+        return err_response("缺少代币地址 | Missing token address", 400, user_id,
+                            {"parameters": body.parameters})
+    strategy = await _get_trading_strategy()
+    orders = await strategy.generate_orders(body.parameters)
+    results = await strategy.execute_strategy(orders)
+    # Write-only side effect; don't hold the response for logger I/O
+    logging_service.log_user_action_nowait("execute_trade", {"parameters": body.parameters}, user_id)
+    return {"results": results}
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """Quote cache hit/miss counters | 报价缓存命中统计"""
+    client = await _get_jupiter_client()
+    stats = {}
+    for category, counters in (("quote", client.cache_stats),
+                               ("llm", defi_agent.cache_stats)):
+        hits, misses = counters["hits"], counters["misses"]
+        total = hits + misses
+        stats[category] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0
+        }
+    return stats
+
+@app.get("/api/recent_trades")
+async def get_recent_trades(limit: int = 100):
+    """Recent user actions, streamed | 最近的用户操作（流式）"""
+    limit = min(limit, 1000)
+
+    async def _stream():
+        # One JSON array, but emitted per document as the cursor
+        # advances — first byte goes out before the last doc is read
+        yield b'{"actions":['
+        first = True
+        async for doc in logging_service.iter_recent_actions(limit):
+            yield (b"" if first else b",") + orjson.dumps(doc, default=str)
+            first = False
+        yield b"]}"
+
+    return StreamingResponse(_stream(), media_type="application/json")
+
+async def _warmup():
+    """Pay cold-start costs before the first real request
+
+    Pre-resolves Jupiter's hostname, dials a throwaway quote so the TLS
+    session and connection pool exist, and pushes one log entry so the
+    Mongo pool opens. Failures are ignored — warmup is best-effort and
+    the app must come up even when upstreams are flaky.
+    """
+    try:
+        await asyncio.to_thread(socket.getaddrinfo, "quote-api.jup.ag", 443)
+    except Exception:
+        pass
+    try:
+        client = await _get_jupiter_client()
+        await client.get_quote(client.sol_token,
+                               "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+                               "1000000")
+    except Exception:
+        pass
+    logging_service.log_user_action_nowait("warmup", {}, "_sys_")
+
+@app.on_event("startup")
+async def startup():
+    asyncio.create_task(_warmup())
+
+@app.on_event("shutdown")
+async def shutdown():
+    if _jupiter_client is not None:
+        await _jupiter_client.close()
+    await defi_agent.aclose()
+    await logging_service.flush()
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run("src.web.app_v2:app", host="0.0.0.0", port=int(os.getenv("PORT", "8080")),
+                loop="uvloop", http="httptools")
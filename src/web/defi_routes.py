@@ -0,0 +1,31 @@
+"""
+DeFi Routes
+Chat endpoint turning natural-language instructions into trades
+"""
+
+from fastapi import APIRouter, Header
+from pydantic import BaseModel, Field
+from src.agents.defi_dialogue_agent import DefiDialogueAgent
+from src.services.logging_service import logging_service
+from src.web.errors import err_response
+
+router = APIRouter()
+
+# One agent for every request; each instance would otherwise carry its
+# own HTTP state to the model API
+agent = DefiDialogueAgent()
+
+class ChatRequest(BaseModel):
+    # Bounds are enforced during the single pydantic-core parse, so an
+    # oversized or empty body is rejected before the handler runs
+    instruction: str = Field(min_length=1, max_length=512)
+
+@router.post("/api/chat")
+async def chat(body: ChatRequest, user_id: str = Header("anonymous", alias="X-User-ID")):
+    """Process a natural-language instruction | 处理自然语言指令"""
+    if not body.instruction.strip():
+        return err_response("指令不能为空 | Instruction must not be empty", 400, user_id)
+    result = await agent.process_user_input(body.instruction, user_id)
+    # Write-only side effect; don't hold the response for logger I/O
+    logging_service.log_user_action_nowait("chat", {"instruction": body.instruction}, user_id)
+    return result
@@ -0,0 +1,14 @@
+"""
+Web Errors
+One error responder shared by the route modules
+"""
+
+from typing import Any, Dict, Optional
+from fastapi.responses import ORJSONResponse
+from src.services.logging_service import logging_service
+
+def err_response(message: str, status: int, user_id: str = "anonymous",
+                 context: Optional[Dict[str, Any]] = None) -> ORJSONResponse:
+    """Log the error off the request path and return the response at once"""
+    logging_service.log_error_nowait(message, context or {}, user_id)
+    return ORJSONResponse({"status": "error", "message": message}, status_code=status)
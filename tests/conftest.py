@@ -0,0 +1,72 @@
+"""
+Shared fixtures for the integration test scripts
+"""
+
+import asyncio
+import os
+import sys
+import pytest_asyncio
+import websockets
+
+# uvloop cuts event-loop overhead 2-4x on the small-frame send/recv
+# loops these tests run; setting the policy here, before pytest-asyncio
+# creates its first loop, covers every test. uvloop has no Windows
+# build, so that platform keeps the selector loop.
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+WS_URI = os.getenv("LUMIX_WS_URI", "ws://localhost:8000/api/v1/ws")
+
+# Structured payloads go through these instead of per-test json
+# plumbing — orjson encode/decode is the dominant CPU cost in
+# high-rate recv loops. Falls back to stdlib where orjson isn't
+# installed.
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    import json
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+async def send_j(ws, obj):
+    """Send a dict as one orjson-encoded frame"""
+    await ws.send(_dumps(obj))
+
+async def recv_j(ws):
+    """Receive one frame and decode it with orjson"""
+    return _loads(await ws.recv())
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "performance: throughput/latency tests, heavier than the default run"
+    )
+    # Registered so runs without pytest-xdist stay warning-free; with
+    # it installed, `pytest -n 3 -m performance` spreads the groups
+    # across workers
+    config.addinivalue_line(
+        "markers", "xdist_group(name): pin a test to one pytest-xdist worker group"
+    )
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def ws():
+    """One WebSocket for the whole session; reconnecting per test re-pays
+    the TCP+TLS handshake. Compression stays off — permessage-deflate
+    costs more CPU than it saves on our few-KB JSON frames over
+    localhost (production clients on slow links should re-enable it).
+    max_size/max_queue bound buffering so the recv loops can't balloon
+    memory if the server floods updates."""
+    async with websockets.connect(
+        WS_URI,
+        ping_interval=20,
+        ping_timeout=20,
+        max_size=2 ** 20,
+        max_queue=64,
+        compression=None
+    ) as w:
+        yield w
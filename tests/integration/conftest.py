@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the in-process integration tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.web.app_v2 import app
+
+@pytest.fixture(scope="session")
+def test_client():
+    """One TestClient for the whole session; each construction spins up
+    the full app graph and a fresh ASGI transport, which dominated the
+    old per-test setup time."""
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture(scope="session")
+def connected_ws(test_client):
+    """One connected /ws channel reused by every ping-only test"""
+    with test_client.websocket_connect("/ws") as ws:
+        yield ws
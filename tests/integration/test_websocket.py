@@ -0,0 +1,58 @@
+"""
+In-process websocket behaviour against the v2 app
+
+The performance tests carry distinct xdist_group marks so
+`pytest -n 3 -m performance` runs each long pinging loop on its own
+worker instead of serially on one.
+"""
+
+import time
+import pytest
+
+def test_websocket_ping(connected_ws):
+    connected_ws.send_text("ping")
+    assert connected_ws.receive_text() == "pong"
+
+def test_websocket_echo(connected_ws):
+    connected_ws.send_text("买入 BONK")
+    assert connected_ws.receive_text() == "买入 BONK"
+
+@pytest.mark.performance
+@pytest.mark.xdist_group("ws_perf_stability")
+def test_websocket_stability(test_client):
+    # Fan out connections, not clients — the app graph is built once
+    for _ in range(10):
+        with test_client.websocket_connect("/ws") as ws:
+            ws.send_text("ping")
+            assert ws.receive_text() == "pong"
+
+@pytest.mark.performance
+@pytest.mark.xdist_group("ws_perf_latency")
+def test_response_times(connected_ws):
+    start = time.perf_counter()
+    for _ in range(50):
+        connected_ws.send_text("ping")
+        assert connected_ws.receive_text() == "pong"
+    elapsed = time.perf_counter() - start
+    # In-process ASGI round trips; anything near a second means the
+    # app is doing per-message work it shouldn't
+    assert elapsed < 5.0
+
+@pytest.mark.performance
+@pytest.mark.xdist_group("ws_perf_throughput")
+def test_memory_usage(connected_ws):
+    # Pipeline pings in chunks of 64: fire the whole chunk before
+    # reading any reply, so the cost per message is a buffered write
+    # instead of a full send->recv round trip each
+    total, chunk = 1000, 64
+    replies = []
+    sent = 0
+    while sent < total:
+        n = min(chunk, total - sent)
+        for _ in range(n):
+            connected_ws.send_text("ping")
+        for _ in range(n):
+            replies.append(connected_ws.receive_text())
+        sent += n
+    assert len(replies) == total
+    assert all(r == "pong" for r in replies)
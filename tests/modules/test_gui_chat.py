@@ -0,0 +1,34 @@
+"""
+ChatWindow behaviour (requires PyQt6)
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtWidgets import QApplication
+from src.modules.gui_chat import ChatWindow
+
+@pytest.fixture(scope="session")
+def app():
+    # Qt allows one QApplication per process and its init dominates
+    # test wall time, so build (or adopt) it once for the whole session
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def chat_window(app):
+    window = ChatWindow()
+    yield window
+    window.deleteLater()
+
+def test_send_message_appends_history(chat_window):
+    chat_window.input_box.setText('买入 {"token": "BONK", "amount_sol": 1}')
+    chat_window.send_message()
+    text = chat_window.history.toPlainText()
+    assert "BONK" in text
+    assert chat_window.input_box.text() == ""
+
+def test_empty_input_ignored(chat_window):
+    chat_window.input_box.setText("   ")
+    chat_window.send_message()
+    assert chat_window.history.toPlainText() == ""
@@ -0,0 +1,30 @@
+"""
+Parameter extraction for NLPProcessor
+"""
+
+import orjson
+import pytest
+from src.modules.nlp_processor import NLPProcessor, _fast_json_loads
+
+@pytest.fixture
+def processor():
+    return NLPProcessor()
+
+def test_extract_parameters_success(processor):
+    reply = '好的，立即买入。{"token": "BONK", "direction": "buy", "amount_sol": 0.5}'
+    result = processor.process_instruction(reply)
+    assert result["parameters"]["token"] == "BONK"
+    assert result["parameters"]["amount_sol"] == 0.5
+    assert result["confidence"] == "high"
+
+def test_extract_parameters_malformed(processor):
+    assert processor._extract_parameters("no json here") == {}
+    assert processor._extract_parameters('{"broken":') == {}
+    assert processor._extract_parameters('["not", "a", "dict"]') == {}
+
+def test_fast_json_loads_dispatch_parity():
+    small = '{"token": "BONK"}'
+    large = orjson.dumps({"rows": list(range(200))}).decode()
+    assert len(large) >= 512
+    assert _fast_json_loads(small) == {"token": "BONK"}
+    assert _fast_json_loads(large) == {"rows": list(range(200))}
@@ -0,0 +1,61 @@
+"""
+Liquidity scoring and token analysis for TokenInfoModule
+"""
+
+import functools
+from unittest.mock import Mock
+import numpy as np
+import pytest
+from src.data.chainstack_client import ChainStackClient
+from src.modules.token_info import TokenInfoModule
+
+@functools.lru_cache(maxsize=1)
+def _market_data():
+    # Plain arrays: building the equivalent DataFrame costs ~500x more
+    # than this for three rows, and the module only reads the columns
+    return {
+        "Close": np.array([1.0, 1.1, 1.2]),
+        "Volume": np.array([1000, 1100, 1200], dtype=np.int64)
+    }
+
+@pytest.fixture(scope="module")
+def mock_chainstack_client():
+    client = Mock(spec=ChainStackClient)
+    client.get_token_holders.return_value = [{"amount": "1000"}] * 10
+    client.get_token_data.return_value = _market_data()
+    return client
+
+@pytest.fixture
+def token_info_module(mock_chainstack_client):
+    # Per-test reset keeps call counts clean without rebuilding the
+    # mock (or its market data) each time
+    mock_chainstack_client.reset_mock()
+    mock_chainstack_client.get_token_holders.return_value = [{"amount": "1000"}] * 10
+    mock_chainstack_client.get_token_data.return_value = _market_data()
+    return TokenInfoModule(client=mock_chainstack_client)
+
+@pytest.fixture
+def module():
+    return TokenInfoModule(client=Mock(spec=ChainStackClient))
+
+@pytest.mark.asyncio
+async def test_analyze_token(token_info_module, mock_chainstack_client):
+    result = await token_info_module.analyze_token("DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263")
+    assert result["liquidity_score"] > 0.9
+    assert result["avg_volume"] == pytest.approx(1100.0)
+    assert result["price_change"] == pytest.approx(0.2)
+    mock_chainstack_client.get_token_holders.assert_called_once()
+
+def test_calculate_liquidity_score(module):
+    even = [{"amount": "1000"} for _ in range(100)]
+    concentrated = [{"amount": "1"} for _ in range(99)] + [{"amount": "1000000"}]
+    even_score = module.calculate_liquidity_score(even)
+    concentrated_score = module.calculate_liquidity_score(concentrated)
+    assert even_score > 0.95
+    assert concentrated_score < 0.1
+    assert even_score > concentrated_score
+
+def test_calculate_liquidity_score_edge_cases(module):
+    assert module.calculate_liquidity_score([]) == 0.0
+    assert module.calculate_liquidity_score([{"amount": "0"}] * 5) == 0.0
+    assert 0.0 <= module.calculate_liquidity_score([{"amount": "42"}]) <= 1.0
@@ -0,0 +1,68 @@
+"""
+Order recovery for OrderManager (requires MongoDB)
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+import pytest_asyncio
+from src.services.order_manager import OrderManager
+
+TEST_USER = "test_order_manager"
+BONK = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+WIF = "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm"
+
+async def seed_orders(manager, specs):
+    """Insert order docs in one insert_many round trip
+
+    Seeding through create_timed_order/create_conditional_order costs
+    an insert plus tracking work per order; tests that only need rows
+    in Mongo write them all at once.
+    """
+    now = datetime.now(timezone.utc)
+    docs = []
+    for spec in specs:
+        doc = {
+            "id": str(uuid.uuid4()),
+            "user_id": TEST_USER,
+            "token": spec["token"],
+            "direction": spec.get("direction", "buy"),
+            "amount_sol": spec.get("amount_sol", 0.1),
+            "status": spec.get("status", "pending"),
+            "signature": None,
+            "created_at": now
+        }
+        for key in ("execute_at", "condition"):
+            if key in spec:
+                doc[key] = spec[key]
+        docs.append(doc)
+    await manager.orders.insert_many(docs, ordered=False)
+    return docs
+
+@pytest_asyncio.fixture
+async def manager():
+    m = OrderManager()
+    await m.orders.delete_many({"user_id": TEST_USER})
+    yield m
+    await m.orders.delete_many({"user_id": TEST_USER})
+
+@pytest.mark.asyncio
+async def test_recover_pending_orders(manager):
+    past = datetime.now(timezone.utc) - timedelta(minutes=5)
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    docs = await seed_orders(manager, [
+        {"token": BONK, "execute_at": past},
+        {"token": BONK, "execute_at": future},
+        {"token": WIF, "condition": {"type": "price_above", "value": 1.0}}
+    ])
+    await manager.recover_pending_orders()
+    # One filtered find brings back every seeded order's end state
+    recovered = {
+        doc["id"]: doc
+        async for doc in manager.orders.find({"id": {"$in": [d["id"] for d in docs]}})
+    }
+    assert recovered[docs[0]["id"]]["status"] == "cancelled"
+    assert recovered[docs[0]["id"]]["reason"] == "system_restart_missed_execution"
+    assert recovered[docs[1]["id"]]["status"] == "pending"
+    assert recovered[docs[2]["id"]]["status"] == "pending"
+    assert {BONK, WIF} <= manager._tracked_tokens
@@ -0,0 +1,15 @@
+"""
+Conditional order placement over the shared WebSocket
+"""
+
+import pytest
+from conftest import recv_j, send_j
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_conditional_order(ws):
+    await send_j(ws, {
+        "type": "trade_request",
+        "instruction": "当 BONK 上涨 10% 时卖出一半 | sell half BONK when it rises 10%"
+    })
+    reply = await recv_j(ws)
+    assert reply.get("type") != "error", reply
@@ -0,0 +1,32 @@
+"""
+Dialogue round-trip over the shared WebSocket
+"""
+
+import sys
+import orjson
+import pytest
+from conftest import recv_j, send_j
+from src.utils import setup_logger
+
+# Queue-backed logger from src.utils: the recv loop only enqueues;
+# formatting and the stdout flush happen on the listener thread
+log = setup_logger(__name__)
+_PRETTY = sys.stdout.isatty()
+
+INSTRUCTIONS = [
+    "买入 0.5 SOL 的 BONK",
+    "sell half my WIF position",
+    "当价格跌 5% 时卖出 | sell when price drops 5%"
+]
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_dialog(ws):
+    for instruction in INSTRUCTIONS:
+        await send_j(ws, {"type": "trade_request", "instruction": instruction})
+        reply = await recv_j(ws)
+        if _PRETTY:
+            log.info("%s ->\n%s", instruction,
+                     orjson.dumps(reply, option=orjson.OPT_INDENT_2).decode())
+        else:
+            log.info("%s -> %s", instruction, orjson.dumps(reply).decode())
+        assert reply.get("type") != "error", reply
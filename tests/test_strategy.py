@@ -0,0 +1,43 @@
+"""
+Order generation and execution for TradingStrategy
+"""
+
+import asyncio
+import pytest
+from src.trading.trading_strategy_v2 import TradingStrategy
+
+class FakeJupiterClient:
+    """Canned quote/swap responses so the test never leaves the process"""
+    sol_token = "So11111111111111111111111111111111111111112"
+
+    async def get_quote(self, input_mint, output_mint, amount, **kwargs):
+        return {"inputMint": input_mint, "outputMint": output_mint, "outAmount": amount}
+
+    async def execute_swap(self, quote, wallet_address):
+        return "5" * 87
+
+PARAMETER_SETS = [
+    {"token": "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263", "direction": "buy"},
+    {"token": "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm", "direction": "sell"},
+    {"token": "So11111111111111111111111111111111111111112", "direction": "buy"}
+]
+
+@pytest.mark.asyncio
+async def test_strategy_generation():
+    strategy = TradingStrategy(jupiter_client=FakeJupiterClient())
+    # Generation for independent parameter sets runs concurrently;
+    # execution stays after the gather because it consumes the orders —
+    # that ordering dependency is real, not incidental.
+    order_lists = await asyncio.gather(
+        *[strategy.generate_orders(p) for p in PARAMETER_SETS]
+    )
+    orders = [order for orders in order_lists for order in orders]
+    assert len(orders) == len(PARAMETER_SETS)
+    assert orders[1]["input_mint"] == PARAMETER_SETS[1]["token"]
+    results = await strategy.execute_strategy(orders)
+    assert all(r["status"] == "executed" for r in results)
+
+@pytest.mark.asyncio
+async def test_strategy_skips_missing_token():
+    strategy = TradingStrategy(jupiter_client=FakeJupiterClient())
+    assert await strategy.generate_orders({"direction": "buy"}) == []
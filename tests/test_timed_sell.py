@@ -0,0 +1,15 @@
+"""
+Timed sell placement over the shared WebSocket
+"""
+
+import pytest
+from conftest import recv_j, send_j
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_timed_sell(ws):
+    await send_j(ws, {
+        "type": "trade_request",
+        "instruction": "10 分钟后卖出全部 WIF | sell all WIF in 10 minutes"
+    })
+    reply = await recv_j(ws)
+    assert reply.get("type") != "error", reply
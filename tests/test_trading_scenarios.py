@@ -0,0 +1,28 @@
+"""
+Multi-step trading scenarios on the shared WebSocket
+"""
+
+import asyncio
+import pytest
+from conftest import recv_j, send_j
+
+SCENARIOS = [
+    {"type": "trade_request", "instruction": "buy 1 SOL of BONK with 2.5% slippage"},
+    {"type": "trade_request", "instruction": "全仓卖出 BONK"},
+    {"type": "trade_request", "instruction": "show my open positions"}
+]
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_trading_scenarios(ws):
+    # Pipeline: fire all requests before reading any reply, so total
+    # wall time is ~1 RTT instead of one send->recv round trip each.
+    # correlation_id pairs replies with requests since the server may
+    # answer out of order.
+    pending = {}
+    for i, scenario in enumerate(SCENARIOS):
+        pending[str(i)] = {**scenario, "correlation_id": str(i)}
+    await asyncio.gather(*[send_j(ws, m) for m in pending.values()])
+    while pending:
+        reply = await asyncio.wait_for(recv_j(ws), timeout=10)
+        assert reply.get("type") != "error", reply
+        pending.pop(reply.get("correlation_id"), None)